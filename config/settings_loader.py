@@ -1,13 +1,32 @@
 from pathlib import Path
+from typing import Dict, Tuple
+
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML ohne libyaml
+    from yaml import SafeLoader
+
 SETTINGS_PATH = Path("config/settings.yaml")
 
+# Geparste Settings je (Pfad, mtime_ns) – Änderungen an der Datei invalidieren automatisch.
+_CACHE: Dict[Tuple[str, int], dict] = {}
+
 
 def load_settings() -> dict:
-    """Lädt die Einstellungen aus config/settings.yaml."""
+    """Lädt die Einstellungen aus config/settings.yaml (gecacht bis zur nächsten Dateiänderung)."""
     if not SETTINGS_PATH.exists():
         raise FileNotFoundError(f"settings.yaml fehlt unter {SETTINGS_PATH}")
 
+    key = (str(SETTINGS_PATH), SETTINGS_PATH.stat().st_mtime_ns)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+
     with SETTINGS_PATH.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        settings = yaml.load(f, Loader=SafeLoader)
+
+    _CACHE.clear()
+    _CACHE[key] = settings
+    return settings
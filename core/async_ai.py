@@ -1,33 +1,68 @@
 import asyncio
 import hashlib
-import json
-import os
 import re
-from typing import Any, Dict, Optional
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from dotenv import load_dotenv
+import orjson
 from loguru import logger
-from openai import AsyncOpenAI
 
-from utils.cache import get_cache, set_cache
+from config.settings_loader import load_settings
+from utils.cache import (
+    SIGNAL_CACHE_MAX_AGE_DAYS,
+    get_cache,
+    get_semantic_cache,
+    set_cache,
+    set_semantic_cache,
+)
+from utils.openai_client import call_with_retries, get_async_client
 from utils.preprocess import clean_text
-from utils.prompt_loader import load_prompt
+from utils.prompt_loader import load_prompt, render_prompt
 
-load_dotenv()
+# Startwert (performance.max_concurrent_tasks); bei 429 wird halbiert, nach
+# einer Runde erfolgreicher Calls schrittweise wieder bis zum Startwert erhöht.
+MAX_CONCURRENT_OPENAI_CALLS = 5
+_admission = None
+_admission_loop = None
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-_client = None
-_client_loop = None
+DEFAULT_OPENAI_RPM = 500
+DEFAULT_OPENAI_TPM = 200_000
+EXPECTED_RESPONSE_TOKENS = 1000
+_rate_limiter = None
+_rate_limiter_loop = None
 
-MAX_CONCURRENT_OPENAI_CALLS = 5
-_semaphore = None
-_semaphore_loop = None
+# Paraphrasierte/syndizierte Artikel mit ähnlichem Embedding nutzen die
+# bereits vorhandene Analyse statt eines neuen LLM-Calls.
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.87
+
+SIGNAL_MODEL = "gpt-4.1-mini"
+
+# Exakte und semantische Treffer gelten 14 Tage; Modell und Prompt-Hash
+# sind Teil des Keys, damit Modell- oder Prompt-Wechsel alte Analysen nicht wiederverwenden.
+SIGNAL_CACHE_TTL_SECONDS = SIGNAL_CACHE_MAX_AGE_DAYS * 86400
+
+# Artikel aller Aktien landen gemeinsam im Batcher; größere Batches sparen
+# Prompt-Präambel und Round-Trips (per performance.article_batch_size anpassbar).
+ARTICLE_BATCH_SIZE = 16
+ARTICLE_BATCH_WAIT_MS = 50
+_batcher = None
+_batcher_loop = None
 
 SENTIMENT_TO_EMOJI = {
     "positiv": "🟢",
     "neutral": "🟡",
     "negativ": "🔴",
 }
+NEUTRAL_EMOJI = SENTIMENT_TO_EMOJI["neutral"]
+
+# Artikel ohne verwertbaren Inhalt (nur Kurs-/Quote-Seite oder Zwei-Wort-Titel)
+# bekommen direkt das neutrale Fallback-Signal statt eines LLM-Calls.
+MIN_ARTICLE_WORDS = 4
+_BOILERPLATE_TITLE_RE = re.compile(
+    r"\b(?:stock|share)s?\s+(?:price|quote|news)s?\b|\baktienkurs\b|\bkurs\s+aktuell\b",
+    flags=re.IGNORECASE,
+)
 
 ALLOWED_EVENT_TYPES = {
     "geopolitical",
@@ -41,6 +76,55 @@ ALLOWED_EVENT_TYPES = {
     "other",
 }
 ALLOWED_SENTIMENTS = {"positiv", "neutral", "negativ"}
+SENTIMENT_ALIASES = {
+    "positive": "positiv",
+    "negative": "negativ",
+    "neg": "negativ",
+    "pos": "positiv",
+}
+
+# Lokales Lexikon (EN-Feeds, DE-Antworten) – ersetzt den blinden "neutral"-Default,
+# wenn das Modell kein gültiges Sentiment liefert oder der Call fehlschlägt.
+# Englische Wörter/Phrasen mit Wortgrenze auf beiden Seiten (sonst trifft "miss"
+# auch "mission"); deutsche Stämme matchen auch innerhalb von Komposita
+# ("Rekordauftrag", "Gewinnwarnung", "Umsatzplus").
+_POSITIVE_MARKERS = (
+    "beat", "beats", "surge", "surges", "soar", "soars", "rally", "rallies", "record",
+    "upgrade", "upgraded", "outperform", "raises guidance", "raised guidance", "strong",
+    "growth", "gain", "gains", "jump", "jumps", "profit rises",
+    "steigt", "steigen", "erhöht prognose", "gewinn steigt",
+)
+_POSITIVE_STEMS = ("rekord", "plus", "wachstum", "entlast", "stark", "hochgestuft", "übertrifft", "erholt")
+_NEGATIVE_MARKERS = (
+    "miss", "misses", "plunge", "plunges", "slump", "slumps", "fall", "falls", "drop", "drops",
+    "downgrade", "downgraded", "cuts guidance", "cut guidance", "lawsuit", "probe", "weak",
+    "decline", "declines", "loss", "losses", "recall", "layoffs",
+    "fällt", "fallen", "sinkt", "senkt prognose", "bricht ein",
+)
+_NEGATIVE_STEMS = ("einbruch", "warnung", "verlust", "minus", "belast", "schwach", "rückgang", "herabgestuft", "klage")
+# Verneinung bis zu drei Wörter vor dem Marker ("not expected to miss", "kein Einbruch").
+_NEGATION_RE = re.compile(r"\b(?:not|no|nicht|kein\w*)\W+(?:\w+\W+){0,2}$", re.IGNORECASE)
+_NEGATION_WINDOW = 60
+
+
+def _marker_re(words: Tuple[str, ...], stems: Tuple[str, ...]) -> re.Pattern:
+    alternatives = [r"\b(?:" + "|".join(re.escape(m) for m in words) + r")\b"]
+    alternatives += [re.escape(stem) for stem in stems]
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+_POSITIVE_RE = _marker_re(_POSITIVE_MARKERS, _POSITIVE_STEMS)
+_NEGATIVE_RE = _marker_re(_NEGATIVE_MARKERS, _NEGATIVE_STEMS)
+
+
+def _count_markers(pattern: re.Pattern, text: str) -> int:
+    return sum(
+        1
+        for match in pattern.finditer(text)
+        if not _NEGATION_RE.search(text[max(0, match.start() - _NEGATION_WINDOW):match.start()])
+    )
+
+
 ALLOWED_HORIZONS = {"short", "medium", "long"}
 ALLOWED_CONFIDENCE = {"low", "medium", "high"}
 
@@ -59,44 +143,182 @@ DEFAULT_SIGNAL = {
     "relevance_score": 30,
     "impact_score": 30,
     "causal_chain": "",
-    "emoji": "🟡",
+    "emoji": NEUTRAL_EMOJI,
 }
 
 
-def _get_client() -> AsyncOpenAI:
-    global _client, _client_loop
+def classify_sentiment(text: str) -> str:
+    """Lexikonbasierte Einordnung in positiv/neutral/negativ ohne LLM-Call."""
+    if not text:
+        return "neutral"
+    score = _count_markers(_POSITIVE_RE, text) - _count_markers(_NEGATIVE_RE, text)
+    if score > 0:
+        return "positiv"
+    if score < 0:
+        return "negativ"
+    return "neutral"
+
+
+class AdmissionController:
+    """
+    Begrenzt parallele OpenAI-Calls über Zähler + Condition.
+    Anders als asyncio.Semaphore lässt sich das Limit zur Laufzeit
+    sicher anpassen (z.B. bei 429ern oder freiem Kontingent).
+    """
+
+    def __init__(self, limit: int, max_limit: Optional[int] = None):
+        self._limit = max(1, int(limit))
+        self._max_limit = max(self._limit, int(max_limit or limit))
+        self._active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            self._limit = max(1, int(limit))
+            self._cond.notify_all()
+
+    async def on_rate_limited(self) -> None:
+        """429 erhalten: Parallelität halbieren."""
+        self._successes = 0
+        if self._limit > 1:
+            await self.set_limit(self._limit // 2)
+            logger.warning(f"OpenAI-Rate-Limit – parallele Calls auf {self._limit} reduziert.")
+
+    async def on_success(self) -> None:
+        """Nach `limit` erfolgreichen Calls in Folge das Limit um 1 anheben (bis max_limit)."""
+        self._successes += 1
+        if self._limit < self._max_limit and self._successes >= self._limit:
+            self._successes = 0
+            await self.set_limit(self._limit + 1)
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
+
+
+def _get_admission() -> AdmissionController:
+    global _admission, _admission_loop
     current_loop = asyncio.get_running_loop()
 
-    if _client is None or _client_loop is not current_loop:
-        _client = AsyncOpenAI(api_key=OPENAI_API_KEY)
-        _client_loop = current_loop
-
-    return _client
+    if _admission is None or _admission_loop is not current_loop:
+        perf = load_settings().get("performance", {}) or {}
+        _admission = AdmissionController(int(perf.get("max_concurrent_tasks", MAX_CONCURRENT_OPENAI_CALLS)))
+        _admission_loop = current_loop
+
+    return _admission
+
+
+class RateLimiter:
+    """
+    Zwei Token-Buckets (Requests/Minute und Tokens/Minute) passend zu den
+    OpenAI-Limits. Reserviert vor dem Call eine Schätzung und erstattet
+    nicht verbrauchte Tokens anhand von response.usage zurück.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self._rpm = float(max(1, int(rpm)))
+        self._tpm = float(max(1, int(tpm)))
+        self._requests = self._rpm
+        self._tokens = self._tpm
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60.0)
+        self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60.0)
+
+    async def acquire(self, requested_tokens: int) -> int:
+        needed = float(min(max(1, int(requested_tokens)), self._tpm))
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1.0 and self._tokens >= needed:
+                    self._requests -= 1.0
+                    self._tokens -= needed
+                    return int(needed)
+
+                wait_requests = max(0.0, 1.0 - self._requests) * 60.0 / self._rpm
+                wait_tokens = max(0.0, needed - self._tokens) * 60.0 / self._tpm
+                await asyncio.sleep(max(wait_requests, wait_tokens))
+
+    def refund(self, tokens: int) -> None:
+        if tokens <= 0:
+            return
+        self._refill()
+        self._tokens = min(self._tpm, self._tokens + tokens)
+
+
+def _get_rate_limiter() -> RateLimiter:
+    global _rate_limiter, _rate_limiter_loop
+    current_loop = asyncio.get_running_loop()
 
+    if _rate_limiter is None or _rate_limiter_loop is not current_loop:
+        perf = load_settings().get("performance", {}) or {}
+        _rate_limiter = RateLimiter(
+            rpm=perf.get("openai_rpm", DEFAULT_OPENAI_RPM),
+            tpm=perf.get("openai_tpm", DEFAULT_OPENAI_TPM),
+        )
+        _rate_limiter_loop = current_loop
 
-def _get_semaphore() -> asyncio.Semaphore:
-    global _semaphore, _semaphore_loop
-    current_loop = asyncio.get_running_loop()
+    return _rate_limiter
 
-    if _semaphore is None or _semaphore_loop is not current_loop:
-        _semaphore = asyncio.Semaphore(MAX_CONCURRENT_OPENAI_CALLS)
-        _semaphore_loop = current_loop
 
-    return _semaphore
+def _estimate_tokens(prompt: str, article_count: int = 1) -> int:
+    return len(prompt) // 4 + EXPECTED_RESPONSE_TOKENS * max(1, article_count)
 
 
-def _build_prompt(article: Dict[str, Any], stock_name: str) -> str:
-    prompt = load_prompt("article_signal")
-    mapping = {
+def _prompt_fields(article: Dict[str, Any], stock_name: str) -> Dict[str, str]:
+    return {
         "stock_name": stock_name or article.get("stock_name", "") or "Unbekannt",
         "source_name": str(article.get("source_name", "")),
         "published_at": str(article.get("published_at", "")),
         "article_title": str(article.get("title", "")),
         "article_text": str(article.get("content", "")),
     }
-    for key, value in mapping.items():
-        prompt = prompt.replace(f"{{{key}}}", value)
-    return prompt
+
+
+def _build_prompt(article: Dict[str, Any], stock_name: str) -> str:
+    return render_prompt("article_signal", _prompt_fields(article, stock_name))
+
+
+def _build_batch_prompt(batch: List[Tuple[Dict[str, Any], str]]) -> str:
+    blocks = []
+    for idx, (article, stock_name) in enumerate(batch, start=1):
+        fields = _prompt_fields(article, stock_name)
+        blocks.append(
+            f"### Artikel {idx}\n"
+            f"- Aktie: {fields['stock_name']}\n"
+            f"- Quelle: {fields['source_name']}\n"
+            f"- Veröffentlichungszeit: {fields['published_at']}\n"
+            f"- Titel: {fields['article_title']}\n"
+            f"Text:\n{fields['article_text']}"
+        )
+    return render_prompt("article_signal_batch", {"articles": "\n\n".join(blocks)})
 
 
 def _extract_json_payload(text: str) -> Optional[Dict[str, Any]]:
@@ -109,7 +331,7 @@ def _extract_json_payload(text: str) -> Optional[Dict[str, Any]]:
         candidate = re.sub(r"\s*```$", "", candidate)
 
     try:
-        data = json.loads(candidate)
+        data = orjson.loads(candidate)
         if isinstance(data, dict):
             return data
     except Exception:
@@ -122,7 +344,7 @@ def _extract_json_payload(text: str) -> Optional[Dict[str, Any]]:
 
     clipped = candidate[start : end + 1]
     try:
-        data = json.loads(clipped)
+        data = orjson.loads(clipped)
         if isinstance(data, dict):
             return data
     except Exception:
@@ -166,14 +388,8 @@ def _norm_sectors(raw: Any) -> list:
 
 def _normalize_signal(payload: Optional[Dict[str, Any]], article: Dict[str, Any]) -> Dict[str, Any]:
     p = payload or {}
-    sentiment_aliases = {
-        "positive": "positiv",
-        "negative": "negativ",
-        "neg": "negativ",
-        "pos": "positiv",
-    }
 
-    sentiment = _norm_choice(p.get("sentiment"), ALLOWED_SENTIMENTS, "neutral", sentiment_aliases)
+    sentiment = _norm_choice(p.get("sentiment"), ALLOWED_SENTIMENTS, "", SENTIMENT_ALIASES)
     confidence = _norm_choice(p.get("confidence"), ALLOWED_CONFIDENCE, "low")
     event_type = _norm_choice(p.get("event_type"), ALLOWED_EVENT_TYPES, "other")
     horizon = _norm_choice(p.get("time_horizon"), ALLOWED_HORIZONS, "short")
@@ -188,6 +404,17 @@ def _normalize_signal(payload: Optional[Dict[str, Any]], article: Dict[str, Any]
     relevance_score = _norm_score(p.get("relevance_score"), default=30)
     impact_score = _norm_score(p.get("impact_score"), default=30)
 
+    if not sentiment:
+        sentiment = classify_sentiment(
+            " ".join(
+                [
+                    str(article.get("title", "")),
+                    str(p.get("stock_specific_impact") or ""),
+                    str(p.get("direct_effect") or ""),
+                ]
+            )
+        )
+
     chain = f"{event} -> {direct_effect} -> {market_reaction} -> {stock_impact}"
     return {
         "event": event[:260],
@@ -204,59 +431,372 @@ def _normalize_signal(payload: Optional[Dict[str, Any]], article: Dict[str, Any]
         "relevance_score": relevance_score,
         "impact_score": impact_score,
         "causal_chain": chain[:1200],
-        "emoji": SENTIMENT_TO_EMOJI.get(sentiment, "🟡"),
+        "emoji": SENTIMENT_TO_EMOJI[sentiment],
     }
 
 
+@lru_cache(maxsize=1)
+def _prompt_version() -> str:
+    """Hash der Signal-Prompts – eine Prompt-Änderung invalidiert alte Cache-Einträge."""
+    raw = load_prompt("article_signal") + load_prompt("article_signal_batch")
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
 def _cache_key(article: Dict[str, Any], stock_name: str) -> str:
+    # Inhaltsbasiert statt Link/Zeitstempel: syndizierte Artikel (gleicher Titel + Text
+    # über mehrere Feeds) treffen denselben Eintrag. Aktie bleibt Teil des Keys,
+    # weil stock_specific_impact aktienspezifisch ist.
+    content = " ".join(str(article.get("content", "")).split())
     raw_key = "|".join(
         [
+            SIGNAL_MODEL,
+            _prompt_version(),
             str(stock_name or ""),
-            str(article.get("link", "")),
-            str(article.get("title", "")),
-            str(article.get("published_at", "")),
+            " ".join(str(article.get("title", "")).split()),
+            content,
         ]
     )
-    digest = hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+    digest = hashlib.blake2b(raw_key.encode("utf-8"), digest_size=16).hexdigest()
     return f"signal::{digest}"
 
 
+def _get_cached_signal(key: str) -> Optional[Dict[str, Any]]:
+    cached = get_cache(key)
+    if not isinstance(cached, dict) or time.time() - cached.get("ts", 0) >= SIGNAL_CACHE_TTL_SECONDS:
+        return None
+    signal = cached.get("signal")
+    return signal if isinstance(signal, dict) and signal.get("event") else None
+
+
+def _set_cached_signal(key: str, signal: Dict[str, Any]) -> None:
+    set_cache(key, {"ts": time.time(), "signal": signal})
+
+
+async def _call_model(prompt: str, article_count: int = 1) -> str:
+    admission = _get_admission()
+
+    async def _attempt() -> str:
+        async with admission:
+            limiter = _get_rate_limiter()
+            reserved = await limiter.acquire(_estimate_tokens(prompt, article_count))
+            try:
+                response = await get_async_client().responses.create(
+                    model=SIGNAL_MODEL,
+                    input=prompt,
+                    text={"format": {"type": "json_object"}},
+                )
+            except Exception:
+                limiter.refund(reserved)
+                raise
+        used = getattr(getattr(response, "usage", None), "total_tokens", None)
+        if isinstance(used, int):
+            limiter.refund(reserved - used)
+        await admission.on_success()
+        return response.output_text.strip()
+
+    return await call_with_retries(_attempt, on_rate_limit=admission.on_rate_limited)
+
+
 async def _extract_signal(article: Dict[str, Any], stock_name: str) -> Dict[str, Any]:
     prompt = _build_prompt(article, stock_name)
-    response = await _get_client().responses.create(
-        model="gpt-4.1-mini",
-        input=prompt,
-    )
-    payload = _extract_json_payload(response.output_text.strip())
+    payload = _extract_json_payload(await _call_model(prompt))
     signal = _normalize_signal(payload, article)
     if not payload:
         logger.warning("Konnte kein valides JSON aus LLM-Antwort lesen, nutze normalisierten Fallback.")
     return signal
 
 
+_SIGNALS_ARRAY_RE = re.compile(r'"signals"\s*:\s*\[')
+
+
+class _SignalArrayParser:
+    """
+    Inkrementeller Parser für gestreamte Batch-Antworten: liefert jedes
+    Objekt im "signals"-Array, sobald seine schließende Klammer ankommt.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._start = -1
+        self._in_str = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        self._buf += chunk
+        found: List[Dict[str, Any]] = []
+        if self._done:
+            return found
+
+        if not self._in_array:
+            match = _SIGNALS_ARRAY_RE.search(self._buf)
+            if not match:
+                return found
+            self._in_array = True
+            self._pos = match.end()
+
+        buf = self._buf
+        idx = self._pos
+        while idx < len(buf):
+            ch = buf[idx]
+            if self._in_str:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._start = idx
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0 and self._start >= 0:
+                    try:
+                        obj = orjson.loads(buf[self._start : idx + 1])
+                        if isinstance(obj, dict):
+                            found.append(obj)
+                    except Exception:
+                        pass
+                    self._start = -1
+            elif ch == "]" and self._depth == 0:
+                self._done = True
+                idx += 1
+                break
+            idx += 1
+
+        self._pos = idx
+        return found
+
+
+async def _stream_model(
+    prompt: str,
+    article_count: int,
+    on_object: Callable[[Dict[str, Any]], None],
+) -> str:
+    admission = _get_admission()
+
+    async def _attempt() -> str:
+        parser = _SignalArrayParser()
+        async with admission:
+            limiter = _get_rate_limiter()
+            reserved = await limiter.acquire(_estimate_tokens(prompt, article_count))
+            try:
+                async with get_async_client().responses.stream(
+                    model=SIGNAL_MODEL,
+                    input=prompt,
+                    text={"format": {"type": "json_object"}},
+                ) as stream:
+                    async for event in stream:
+                        if event.type == "response.output_text.delta":
+                            for obj in parser.feed(event.delta):
+                                on_object(obj)
+                    response = await stream.get_final_response()
+            except Exception:
+                limiter.refund(reserved)
+                raise
+        used = getattr(getattr(response, "usage", None), "total_tokens", None)
+        if isinstance(used, int):
+            limiter.refund(reserved - used)
+        await admission.on_success()
+        return response.output_text.strip()
+
+    return await call_with_retries(_attempt, on_rate_limit=admission.on_rate_limited)
+
+
+async def _extract_signals(
+    batch: List[Tuple[Dict[str, Any], str]],
+    on_signal: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    if len(batch) == 1:
+        article, stock_name = batch[0]
+        signal = await _extract_signal(article, stock_name)
+        if on_signal:
+            on_signal(0, signal)
+        return [signal]
+
+    signals: Dict[int, Dict[str, Any]] = {}
+
+    def _accept(raw: Dict[str, Any]) -> None:
+        try:
+            idx = int(raw.get("id")) - 1
+        except Exception:
+            return
+        if idx in signals or not 0 <= idx < len(batch):
+            return
+        signals[idx] = _normalize_signal(raw, batch[idx][0])
+        if on_signal:
+            on_signal(idx, signals[idx])
+
+    # Objekte werden schon während des Streams ausgeliefert; der Volltext
+    # dient nur noch als Fallback, falls das Streaming-Parsing nichts fand.
+    text = await _stream_model(_build_batch_prompt(batch), len(batch), _accept)
+    payload = _extract_json_payload(text) or {}
+    for raw in payload.get("signals") or []:
+        if isinstance(raw, dict):
+            _accept(raw)
+
+    results: List[Dict[str, Any]] = []
+    for idx, (article, stock_name) in enumerate(batch):
+        if idx not in signals:
+            # Artikel fehlt in der Batch-Antwort -> einzeln nachanalysieren.
+            signals[idx] = await _extract_signal(article, stock_name)
+            if on_signal:
+                on_signal(idx, signals[idx])
+        results.append(signals[idx])
+    return results
+
+
+class ArticleBatcher:
+    """
+    Sammelt Artikel, die innerhalb von max_wait_ms eintreffen, und analysiert
+    bis zu max_batch davon in einem gemeinsamen OpenAI-Call.
+    """
+
+    def __init__(self, max_batch: int = ARTICLE_BATCH_SIZE, max_wait_ms: int = ARTICLE_BATCH_WAIT_MS):
+        self._max_batch = max(1, int(max_batch))
+        self._max_wait = max(0, int(max_wait_ms)) / 1000.0
+        self._pending: List[Tuple[Dict[str, Any], str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight = set()
+        self._by_key: Dict[str, asyncio.Future] = {}
+
+    def submit(self, article: Dict[str, Any], stock_name: str, key: str = "") -> asyncio.Future:
+        # Gleicher Artikel (gleicher Cache-Key) bereits unterwegs -> denselben Future teilen.
+        if key and key in self._by_key:
+            return self._by_key[key]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((article, stock_name, future))
+        if key:
+            self._by_key[key] = future
+            future.add_done_callback(lambda _f, k=key: self._by_key.pop(k, None))
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], str, asyncio.Future]]) -> None:
+        def _resolve(idx: int, signal: Dict[str, Any]) -> None:
+            future = batch[idx][2]
+            if not future.done():
+                future.set_result(signal)
+
+        try:
+            signals = await _extract_signals(
+                [(article, stock_name) for article, stock_name, _ in batch],
+                on_signal=_resolve,
+            )
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for idx, signal in enumerate(signals):
+            _resolve(idx, signal)
+
+
+def _get_batcher() -> ArticleBatcher:
+    global _batcher, _batcher_loop
+    current_loop = asyncio.get_running_loop()
+
+    if _batcher is None or _batcher_loop is not current_loop:
+        perf = load_settings().get("performance", {}) or {}
+        _batcher = ArticleBatcher(
+            max_batch=perf.get("article_batch_size", ARTICLE_BATCH_SIZE),
+            max_wait_ms=perf.get("article_batch_wait_ms", ARTICLE_BATCH_WAIT_MS),
+        )
+        _batcher_loop = current_loop
+
+    return _batcher
+
+
+def _semantic_cache_threshold() -> float:
+    perf_cfg = load_settings().get("performance", {}) or {}
+    return float(perf_cfg.get("semantic_cache_threshold", DEFAULT_SEMANTIC_CACHE_THRESHOLD))
+
+
+def _semantic_namespace(stock_name: str) -> str:
+    # Modell und Prompt-Hash im Namespace, damit ein Wechsel keine alten Analysen liefert.
+    return f"signal::{SIGNAL_MODEL}::{_prompt_version()}::{stock_name}"
+
+
 async def _process_internal(article: Dict[str, Any], stock_name: str) -> Dict[str, Any]:
     key = _cache_key(article, stock_name)
-    cached = get_cache(key)
-    if isinstance(cached, dict) and cached.get("event"):
+    cached = _get_cached_signal(key)
+    if cached is not None:
         return cached
 
+    # Embedding stammt aus dem Novelty-Filter – kein zusätzlicher API-Call.
+    embedding = article.get("_novelty_embedding") or []
+    threshold = _semantic_cache_threshold()
+    semantic_ns = _semantic_namespace(stock_name)
+    if embedding and threshold > 0:
+        # Treffer nicht in den exakten Cache übernehmen: die Analyse gehört zu einem
+        # anderen Artikel und soll nicht unter dessen Key mit neuem Zeitstempel weiterleben.
+        cached = get_semantic_cache(semantic_ns, embedding, threshold, max_age_seconds=SIGNAL_CACHE_TTL_SECONDS)
+        if isinstance(cached, dict) and cached.get("event"):
+            return cached
+
     article_for_ai = dict(article)
     article_for_ai["content"] = clean_text(str(article.get("content", "")))
-    signal = await _extract_signal(article_for_ai, stock_name)
-    set_cache(key, signal)
+    signal = await asyncio.shield(_get_batcher().submit(article_for_ai, stock_name, key=key))
+    _set_cached_signal(key, signal)
+    if embedding and threshold > 0:
+        set_semantic_cache(semantic_ns, embedding, signal)
     return signal
 
 
+def _fallback_signal(article: Dict[str, Any]) -> Dict[str, Any]:
+    event = str(article.get("title") or DEFAULT_SIGNAL["event"])
+    sentiment = classify_sentiment(f"{article.get('title', '')} {article.get('content', '')}")
+    return {
+        **DEFAULT_SIGNAL,
+        "event": event,
+        "sentiment": sentiment,
+        "emoji": SENTIMENT_TO_EMOJI[sentiment],
+        "causal_chain": (
+            f"{event} -> {DEFAULT_SIGNAL['direct_effect']} -> "
+            f"{DEFAULT_SIGNAL['market_reaction']} -> {DEFAULT_SIGNAL['stock_specific_impact']}"
+        ),
+    }
+
+
+def _is_trivial_article(article: Dict[str, Any]) -> bool:
+    if len(str(article.get("content", "")).split()) >= MIN_ARTICLE_WORDS:
+        return False
+    title = str(article.get("title", ""))
+    return len(title.split()) < MIN_ARTICLE_WORDS or bool(_BOILERPLATE_TITLE_RE.search(title))
+
+
 async def process_article(article: Dict[str, Any], stock_name: str = "") -> Dict[str, Any]:
-    async with _get_semaphore():
-        try:
-            return await _process_internal(article, stock_name)
-        except Exception as exc:
-            logger.error(f"Fehler bei Artikel-Analyse: {exc}")
-            fallback = dict(DEFAULT_SIGNAL)
-            fallback["event"] = str(article.get("title") or DEFAULT_SIGNAL["event"])
-            fallback["causal_chain"] = (
-                f"{fallback['event']} -> {fallback['direct_effect']} -> "
-                f"{fallback['market_reaction']} -> {fallback['stock_specific_impact']}"
-            )
-            return fallback
+    if _is_trivial_article(article):
+        return _fallback_signal(article)
+    try:
+        return await _process_internal(article, stock_name)
+    except Exception as exc:
+        logger.error(f"Fehler bei Artikel-Analyse: {exc}")
+        return _fallback_signal(article)
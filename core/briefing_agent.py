@@ -1,20 +1,28 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+try:
+    import uvloop  # optional: schnellere Event-Loop für viele parallele HTTPS-Calls
+except ImportError:  # z.B. Windows
+    uvloop = None
+
 from config.settings_loader import load_settings
-from core.async_ai import process_article
+from core.async_ai import NEUTRAL_EMOJI, SENTIMENT_TO_EMOJI, process_article
 from core.fetch_news import fetch_all_sources
-from core.fetch_prices import get_price_changes
+from core.fetch_prices import get_price_changes_for_lists
 from core.interpretation import build_stock_interpretation
 from core.macro_linker import build_macro_overview
-from core.news_novelty import filter_news_by_novelty
+from core.news_novelty import filter_news_by_novelty, prefetch_embeddings
 from core.news_ranking import rank_articles_for_stock
 from core.report_builder import render_report
 from utils.archive_manager import archive_briefing
+from utils.cache import save_cache
+from utils.http_client import close_http_client
 from utils.news_memory import (
     build_memory_entry,
     load_memory,
@@ -23,53 +31,61 @@ from utils.news_memory import (
     save_memory,
 )
 from utils.notifications import send_briefing_blocks
+from utils.openai_client import close_async_client
+
+
+NOVELTY_DEFAULTS = {
+    "enabled": True,
+    "lookback_days": 14,
+    "memory_retention_days": 90,
+    "semantic_threshold": 0.86,
+    "max_news_per_stock": 3,
+    "min_news_per_stock": 0,
+    "exact_url_dedupe": True,
+    "exact_title_dedupe": True,
+    "include_known_news_reason_in_report": True,
+}
+
+RANKING_WEIGHT_DEFAULTS = {
+    "recency": 0.35,
+    "entity": 0.25,
+    "source_quality": 0.2,
+    "information_density": 0.1,
+    "macro_signal": 0.1,
+}
 
 
 def _novelty_config(settings: Dict[str, Any]) -> Dict[str, Any]:
-    defaults = {
-        "enabled": True,
-        "lookback_days": 14,
-        "memory_retention_days": 90,
-        "semantic_threshold": 0.86,
-        "max_news_per_stock": 3,
-        "min_news_per_stock": 0,
-        "exact_url_dedupe": True,
-        "exact_title_dedupe": True,
-        "include_known_news_reason_in_report": True,
-    }
-    cfg = settings.get("novelty", {})
-    return {**defaults, **cfg}
+    return {**NOVELTY_DEFAULTS, **settings.get("novelty", {})}
 
 
 def _ranking_config(settings: Dict[str, Any], novelty_cfg: Dict[str, Any]) -> Dict[str, Any]:
-    defaults = {
+    cfg = settings.get("ranking", {})
+    merged = {
         "min_relevance_score": 35.0,
         "max_candidates_per_stock": 8,
         "top_news_per_stock": int(novelty_cfg.get("max_news_per_stock", 3)),
-        "weights": {
-            "recency": 0.35,
-            "entity": 0.25,
-            "source_quality": 0.2,
-            "information_density": 0.1,
-            "macro_signal": 0.1,
-        },
+        **cfg,
     }
-    cfg = settings.get("ranking", {})
-    merged = {**defaults, **cfg}
-    merged["weights"] = {**defaults["weights"], **cfg.get("weights", {})}
+    merged["weights"] = {**RANKING_WEIGHT_DEFAULTS, **cfg.get("weights", {})}
     return merged
 
+# Tagesbewegung ab ±0.3 % gilt als positiv/negativ, darunter neutral.
+PRICE_MOVE_THRESHOLD = 0.3
+POSITIVE_EMOJI = SENTIMENT_TO_EMOJI["positiv"]
+NEGATIVE_EMOJI = SENTIMENT_TO_EMOJI["negativ"]
+
 
 def format_stock(s):
     try:
         change = float(s.change_percent)
 
-        if change > 0.3:
-            emoji = "🟢"
-        elif change < -0.3:
-            emoji = "🔴"
+        if change > PRICE_MOVE_THRESHOLD:
+            emoji = POSITIVE_EMOJI
+        elif change < -PRICE_MOVE_THRESHOLD:
+            emoji = NEGATIVE_EMOJI
         else:
-            emoji = "🟡"
+            emoji = NEUTRAL_EMOJI
 
         since_watchlist = getattr(s, "since_watchlist_percent", None)
         watchlist_added_at = str(getattr(s, "watchlist_added_at", "") or "").strip()
@@ -102,7 +118,7 @@ def format_stock(s):
             "symbol": getattr(s, "symbol", "Unknown"),
             "ticker": getattr(s, "ticker", ""),
             "change": "0.00%",
-            "emoji": "🟡",
+            "emoji": NEUTRAL_EMOJI,
             "since_watchlist": "",
         }
 
@@ -127,24 +143,21 @@ def _build_signal_item(
     signal: Dict[str, Any],
 ) -> Dict[str, Any]:
     relevance = signal.get("relevance_score", article.get("relevance_score", 0))
-    out = dict(signal)
-    out.update(
-        {
-            "stock_name": stock_name,
-            "list_name": list_name,
-            "title": article.get("title", ""),
-            "link": article.get("link", ""),
-            "source_name": article.get("source_name", ""),
-            "source_url": article.get("source_url", ""),
-            "published_at": article.get("published_at", ""),
-            "relevance_score": int(round(float(relevance))),
-            "portfolio_exposure": {
-                "in_portfolio": list_name == "portfolio",
-                "in_watchlist": list_name == "watchlist",
-            },
-        }
-    )
-    return out
+    return {
+        **signal,
+        "stock_name": stock_name,
+        "list_name": list_name,
+        "title": article.get("title", ""),
+        "link": article.get("link", ""),
+        "source_name": article.get("source_name", ""),
+        "source_url": article.get("source_url", ""),
+        "published_at": article.get("published_at", ""),
+        "relevance_score": int(round(float(relevance))),
+        "portfolio_exposure": {
+            "in_portfolio": list_name == "portfolio",
+            "in_watchlist": list_name == "watchlist",
+        },
+    }
 
 
 def _fallback_novelty_stats(fetched_count: int) -> Dict[str, Any]:
@@ -166,10 +179,12 @@ async def _analyze_single_stock(
     ranking_cfg: Dict[str, Any],
     list_name: str,
     price_change_map: Dict[str, str],
+    raw_articles: Optional[List[Dict[str, Any]]] = None,
 ) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
     stock_name = item["name"]
-    logger.info(f"Hole News für {stock_name}…")
-    raw_articles = await fetch_all_sources(stock_name)
+    if raw_articles is None:
+        logger.info(f"Hole News für {stock_name}…")
+        raw_articles = await fetch_all_sources(stock_name)
 
     if not raw_articles:
         interpretation = build_stock_interpretation(stock_name, price_change_map.get(stock_name, "0.00%"), [])
@@ -230,22 +245,26 @@ async def _analyze_single_stock(
         )
 
     logger.info(f"Analysiere {len(selected_articles)} Top-Artikel kausal für {stock_name}…")
-    tasks = [asyncio.create_task(process_article(article, stock_name=stock_name)) for article in selected_articles]
-    analyzed = await asyncio.gather(*tasks)
 
-    items: List[Dict[str, Any]] = []
-    pending_entries: List[Dict[str, Any]] = []
-    for article, signal in zip(selected_articles, analyzed):
+    async def _analyze_article(article: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        # Nachbearbeitung direkt nach der jeweiligen Antwort statt nach dem langsamsten Artikel.
+        signal = await process_article(article, stock_name=stock_name)
         signal_item = _build_signal_item(stock_name, list_name, article, signal)
-        items.append(signal_item)
-        pending_entries.append(
-            build_memory_entry(
-                stock_name=stock_name,
-                article=article,
-                summary_text=signal_item.get("causal_chain", signal_item.get("stock_specific_impact", "")),
-                topic_embedding=article.get("_novelty_embedding") or [],
-            )
+        memory_entry = build_memory_entry(
+            stock_name=stock_name,
+            article=article,
+            summary_text=signal_item.get("causal_chain", signal_item.get("stock_specific_impact", "")),
+            topic_embedding=article.get("_novelty_embedding") or [],
         )
+        return signal_item, memory_entry
+
+    # TaskGroup bricht bei einem Fehler die übrigen Artikel-Tasks ab, statt sie weiterlaufen zu lassen.
+    # Die globale LLM-Parallelität begrenzt der Admission-Controller in core.async_ai.
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_analyze_article(article)) for article in selected_articles]
+
+    items: List[Dict[str, Any]] = [task.result()[0] for task in tasks]
+    pending_entries: List[Dict[str, Any]] = [task.result()[1] for task in tasks]
 
     interpretation = build_stock_interpretation(stock_name, price_change_map.get(stock_name, "0.00%"), items)
     result = {
@@ -269,6 +288,34 @@ async def _analyze_single_stock(
     return stock_name, result, pending_entries
 
 
+async def _run_bounded(
+    items: List[Any],
+    worker_fn: Callable[[Any], Awaitable[Any]],
+    max_workers: int,
+) -> List[Any]:
+    """
+    Arbeitet items mit höchstens max_workers parallelen Workern ab.
+    Ergebnisse behalten die Reihenfolge der Eingabe.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for idx, item in enumerate(items):
+        queue.put_nowait((idx, item))
+
+    results: List[Any] = [None] * len(items)
+
+    async def _worker():
+        while True:
+            try:
+                idx, item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results[idx] = await worker_fn(item)
+
+    worker_count = max(1, min(int(max_workers), len(items)))
+    await asyncio.gather(*(_worker() for _ in range(worker_count)))
+    return results
+
+
 async def analyze_news_for_items(
     items: List[Dict[str, Any]],
     memory: Dict[str, Any],
@@ -276,24 +323,26 @@ async def analyze_news_for_items(
     ranking_cfg: Dict[str, Any],
     list_name: str,
     price_change_map: Dict[str, str],
+    max_workers: int = 5,
+    raw_articles_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
     if not items:
         return {}, []
 
-    tasks = [
-        asyncio.create_task(
-            _analyze_single_stock(
-                item=item,
-                memory=memory,
-                novelty_cfg=novelty_cfg,
-                ranking_cfg=ranking_cfg,
-                list_name=list_name,
-                price_change_map=price_change_map,
-            )
-        )
-        for item in items
-    ]
-    results = await asyncio.gather(*tasks)
+    raw_articles_by_name = raw_articles_by_name or {}
+    results = await _run_bounded(
+        items,
+        lambda item: _analyze_single_stock(
+            item=item,
+            memory=memory,
+            novelty_cfg=novelty_cfg,
+            ranking_cfg=ranking_cfg,
+            list_name=list_name,
+            price_change_map=price_change_map,
+            raw_articles=raw_articles_by_name.get(item["name"]),
+        ),
+        max_workers,
+    )
 
     news_map: Dict[str, Any] = {}
     pending: List[Dict[str, Any]] = []
@@ -303,6 +352,44 @@ async def analyze_news_for_items(
     return news_map, pending
 
 
+async def _fetch_raw_articles(
+    names: List[str],
+    max_workers: int,
+) -> Dict[str, List[Dict[str, Any]]]:
+    async def _fetch(name: str) -> List[Dict[str, Any]]:
+        logger.info(f"Hole News für {name}…")
+        return await fetch_all_sources(name)
+
+    fetched = await _run_bounded(names, _fetch, max_workers)
+    return dict(zip(names, fetched))
+
+
+async def _prefetch_news(
+    portfolio_items: List[Dict[str, Any]],
+    watchlist_items: List[Dict[str, Any]],
+    novelty_cfg: Dict[str, Any],
+    max_workers: int,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
+    # Aktien in Portfolio UND Watchlist nur einmal abrufen.
+    names = list(dict.fromkeys(item["name"] for item in portfolio_items + watchlist_items))
+    raw_by_name = await _fetch_raw_articles(names, max_workers)
+
+    raw_pf = {item["name"]: raw_by_name[item["name"]] for item in portfolio_items}
+    # Watchlist bekommt eigene Artikel-Dicts, weil der Novelty-Filter sie pro Liste annotiert.
+    raw_wl = {
+        item["name"]: [dict(a) for a in raw_by_name[item["name"]]] if item["name"] in raw_pf
+        else raw_by_name[item["name"]]
+        for item in watchlist_items
+    }
+
+    # Embeddings für alle Aktien beider Listen in einer Call-Kette statt pro Aktie.
+    if bool(novelty_cfg.get("enabled", True)):
+        await prefetch_embeddings(
+            [article for raw in (raw_pf, raw_wl) for articles in raw.values() for article in articles]
+        )
+    return raw_pf, raw_wl
+
+
 async def gather_news_parallel(
     portfolio_items: List[Dict[str, Any]],
     watchlist_items: List[Dict[str, Any]],
@@ -310,144 +397,247 @@ async def gather_news_parallel(
     novelty_cfg: Dict[str, Any],
     ranking_cfg: Dict[str, Any],
     price_change_map: Dict[str, str],
+    max_workers: int = 5,
+    prefetched: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None,
 ):
+    raw_pf, raw_wl = prefetched or await _prefetch_news(portfolio_items, watchlist_items, novelty_cfg, max_workers)
+
     return await asyncio.gather(
         asyncio.create_task(
             analyze_news_for_items(
-                portfolio_items, memory, novelty_cfg, ranking_cfg, "portfolio", price_change_map
+                portfolio_items, memory, novelty_cfg, ranking_cfg, "portfolio", price_change_map, max_workers,
+                raw_articles_by_name=raw_pf,
             )
         ),
         asyncio.create_task(
             analyze_news_for_items(
-                watchlist_items, memory, novelty_cfg, ranking_cfg, "watchlist", price_change_map
+                watchlist_items, memory, novelty_cfg, ranking_cfg, "watchlist", price_change_map, max_workers,
+                raw_articles_by_name=raw_wl,
             )
         ),
     )
 
 
-def _news_section_to_text(section: Dict[str, Any]) -> str:
-    def _clean_fragment(text: str) -> str:
-        cleaned = " ".join(str(text or "").split()).strip()
-        return cleaned.rstrip(" .;:!?,")
-
-    def _de_floskel(text: str) -> str:
-        cleaned = str(text or "")
-        cleaned = re.sub(r"\b(könnte|dürfte|wahrscheinlich|tendenziell)\b", "", cleaned, flags=re.IGNORECASE)
-        return " ".join(cleaned.split())
-
-    def _finalize_sentence(text: str, max_words: int = 0) -> str:
-        out = " ".join(str(text or "").replace("...", ".").split()).strip()
-        out = out.rstrip(" .;:!?,")
-        if max_words > 0:
-            words = out.split()
-            if len(words) > max_words:
-                out = " ".join(words[:max_words]).rstrip(" .;:!?,")
-        dangling = (" was", " weil", " sodass", " sodass", " dies führt zu", " und", " oder", " dass")
-        lower = out.lower()
-        if any(lower.endswith(x) for x in dangling):
-            out = out.rsplit(" ", 1)[0].rstrip(" .;:!?,")
-        if not out:
-            return "Keine belastbare Aussage verfügbar."
-        return out + "."
-
-    def _dedupe_key(item: Dict[str, Any]) -> str:
-        event = _clean_fragment(_concrete_event(item)).lower()
-        impact = _clean_fragment(
-            item.get("stock_specific_impact", "") or item.get("direct_effect", "") or item.get("market_reaction", "")
-        ).lower()
-        raw = f"{event} {impact}"
-        raw = re.sub(r"[^a-z0-9äöüß ]", " ", raw)
-        return " ".join(raw.split())[:120]
-
-    def _event_type_priority(event_type: str) -> int:
-        et = str(event_type or "").lower()
-        if et in {"geopolitical", "macro", "policy", "commodity"}:
-            return 0
-        if et in {"sector"}:
-            return 1
-        if et in {"earnings", "guidance", "company"}:
-            return 2
-        return 3
-
-    def _driver_sort_key(item: Dict[str, Any]):
-        return (
-            _event_type_priority(item.get("event_type", "")),
-            -(float(item.get("impact_score", 0)) * 0.6 + float(item.get("relevance_score", 0)) * 0.4),
-        )
+async def fetch_prices_parallel(
+    portfolio_items: List[Dict[str, Any]],
+    watchlist_items: List[Dict[str, Any]],
+):
+    """Portfolio- und Watchlist-Kurse (blockierendes yfinance) mit einem Sammel-Download im Thread holen."""
+    return await asyncio.to_thread(get_price_changes_for_lists, portfolio_items, watchlist_items)
+
+
+def _load_pruned_memory(retention_days: int) -> Dict[str, Any]:
+    return prune_memory(load_memory(), retention_days)
 
-    def _is_generic_event(text: str) -> bool:
-        lower = str(text or "").strip().lower()
-        if not lower:
-            return True
-        if lower.startswith(("laut ", "bericht", "meldung", "news:")):
-            return True
-        generic_markers = (
-            "marktstimmung",
-            "optimismus",
-            "pessimismus",
-            "unsicherheit",
-            "sorgen",
-            "volatilität",
-            "anleger",
-            "märkte steigen",
-            "märkte fallen",
-            "aktie steigt",
-            "aktie fällt",
-            "kurs steigt",
-            "kurs fällt",
-            "risikoappetit",
-            "risk-on",
-            "risk-off",
-            "erwartungen",
+
+async def gather_briefing_inputs(
+    portfolio_items: List[Dict[str, Any]],
+    watchlist_items: List[Dict[str, Any]],
+    novelty_cfg: Dict[str, Any],
+    ranking_cfg: Dict[str, Any],
+    max_workers: int = 5,
+):
+    """
+    Kurse und News in einem Event-Loop: yfinance und das News-Memory laden in
+    Threads, während RSS-Feeds geholt und eingebettet werden. Erst die Analyse
+    braucht Kurse und Memory.
+    """
+    price_task = asyncio.create_task(fetch_prices_parallel(portfolio_items, watchlist_items))
+    memory_task = asyncio.create_task(
+        asyncio.to_thread(_load_pruned_memory, int(novelty_cfg.get("memory_retention_days", 90)))
+    )
+    try:
+        logger.info("💹 Hole Kursdaten und News…")
+        prefetched = await _prefetch_news(portfolio_items, watchlist_items, novelty_cfg, max_workers)
+        (pf_data, date), (wl_data, _) = await price_task
+        memory = await memory_task
+
+        pf_fmt = [format_stock(s) for s in pf_data]
+        wl_fmt = [format_stock(s) for s in wl_data]
+        change_map = _price_map(pf_fmt + wl_fmt)
+
+        logger.info("📰 Starte News-Analyse (Ranking -> Analyse)…")
+        news = await gather_news_parallel(
+            portfolio_items=portfolio_items,
+            watchlist_items=watchlist_items,
+            memory=memory,
+            novelty_cfg=novelty_cfg,
+            ranking_cfg=ranking_cfg,
+            price_change_map=change_map,
+            max_workers=max_workers,
+            prefetched=prefetched,
         )
-        return any(marker in lower for marker in generic_markers)
-
-    def _concrete_event(item: Dict[str, Any]) -> str:
-        event = str(item.get("event", "")).strip()
-        title = str(item.get("title", "")).strip()
-        # Regel: Bullet muss mit einem konkreten, nachprüfbaren Event beginnen.
-        if event and not _is_generic_event(event):
-            return event
-        if title:
-            return title
-        return event or "Konkretes Ereignis nicht eindeutig genannt"
-
-    def _compact_signal_text(item: Dict[str, Any]) -> str:
-        event = _de_floskel(_clean_fragment(_concrete_event(item)))
-        direct = _de_floskel(_clean_fragment(item.get("direct_effect", "")))
-        stock = _de_floskel(_clean_fragment(item.get("stock_specific_impact", "")))
-        market = _de_floskel(_clean_fragment(item.get("market_reaction", "")))
-
-        # Ziel: sehr kompakt (1 kurzer Satz), Event zuerst, ohne Doppelpunkt.
-        if stock:
-            text = f"{event}, {stock}"
-        elif direct:
-            text = f"{event}, {direct}"
-        elif market:
-            text = f"{event}, {market}"
-        else:
-            text = str(item.get("causal_chain", "")).strip() or "Kein klarer Grund ableitbar."
-        return _finalize_sentence(_de_floskel(text))
-
-    def _sentiment_label(sentiment: str) -> str:
-        raw = str(sentiment or "").lower().strip()
-        if raw == "positiv":
-            return "Positiv"
-        if raw == "negativ":
-            return "Negativ"
-        return "Neutral"
-
-    text = ""
+        return pf_fmt, wl_fmt, date, memory, news
+    finally:
+        for task in (price_task, memory_task):
+            if not task.done():
+                task.cancel()
+        # Client-Pools gehören zu diesem Loop – vor asyncio.run-Ende schließen.
+        await close_http_client()
+        await close_async_client()
+        save_cache()
+
+
+def _run_async(coro):
+    """asyncio.run mit uvloop (falls installiert) – nur für diese Pipeline, keine globale Policy."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
+_FLOSKEL_RE = re.compile(r"\b(könnte|dürfte|wahrscheinlich|tendenziell)\b", flags=re.IGNORECASE)
+_DANGLING_ENDINGS = (" was", " weil", " sodass", " dies führt zu", " und", " oder", " dass")
+
+
+def _clean_fragment(text: str) -> str:
+    cleaned = " ".join(str(text or "").split()).strip()
+    return cleaned.rstrip(" .;:!?,")
+
+
+def _de_floskel(text: str) -> str:
+    cleaned = _FLOSKEL_RE.sub("", str(text or ""))
+    return " ".join(cleaned.split())
+
+
+def _finalize_sentence(text: str, max_words: int = 0) -> str:
+    out = " ".join(str(text or "").replace("...", ".").split()).strip()
+    out = out.rstrip(" .;:!?,")
+    if max_words > 0:
+        words = out.split()
+        if len(words) > max_words:
+            out = " ".join(words[:max_words]).rstrip(" .;:!?,")
+    lower = out.lower()
+    if any(lower.endswith(x) for x in _DANGLING_ENDINGS):
+        out = out.rsplit(" ", 1)[0].rstrip(" .;:!?,")
+    if not out:
+        return "Keine belastbare Aussage verfügbar."
+    return out + "."
+
+
+def _dedupe_key(item: Dict[str, Any]) -> str:
+    event = _clean_fragment(_concrete_event(item)).lower()
+    impact = _clean_fragment(
+        item.get("stock_specific_impact", "") or item.get("direct_effect", "") or item.get("market_reaction", "")
+    ).lower()
+    raw = f"{event} {impact}"
+    raw = re.sub(r"[^a-z0-9äöüß ]", " ", raw)
+    return " ".join(raw.split())[:120]
+
+
+def _event_type_priority(event_type: str) -> int:
+    et = str(event_type or "").lower()
+    if et in {"geopolitical", "macro", "policy", "commodity"}:
+        return 0
+    if et in {"sector"}:
+        return 1
+    if et in {"earnings", "guidance", "company"}:
+        return 2
+    return 3
+
+
+def _driver_sort_key(item: Dict[str, Any]):
+    return (
+        _event_type_priority(item.get("event_type", "")),
+        -(float(item.get("impact_score", 0)) * 0.6 + float(item.get("relevance_score", 0)) * 0.4),
+    )
+
+
+def _is_generic_event(text: str) -> bool:
+    lower = str(text or "").strip().lower()
+    if not lower:
+        return True
+    if lower.startswith(("laut ", "bericht", "meldung", "news:")):
+        return True
+    generic_markers = (
+        "marktstimmung",
+        "optimismus",
+        "pessimismus",
+        "unsicherheit",
+        "sorgen",
+        "volatilität",
+        "anleger",
+        "märkte steigen",
+        "märkte fallen",
+        "aktie steigt",
+        "aktie fällt",
+        "kurs steigt",
+        "kurs fällt",
+        "risikoappetit",
+        "risk-on",
+        "risk-off",
+        "erwartungen",
+    )
+    return any(marker in lower for marker in generic_markers)
+
+
+def _concrete_event(item: Dict[str, Any]) -> str:
+    event = str(item.get("event", "")).strip()
+    title = str(item.get("title", "")).strip()
+    # Regel: Bullet muss mit einem konkreten, nachprüfbaren Event beginnen.
+    if event and not _is_generic_event(event):
+        return event
+    if title:
+        return title
+    return event or "Konkretes Ereignis nicht eindeutig genannt"
+
+
+def _compact_signal_text(item: Dict[str, Any]) -> str:
+    event = _de_floskel(_clean_fragment(_concrete_event(item)))
+    direct = _de_floskel(_clean_fragment(item.get("direct_effect", "")))
+    stock = _de_floskel(_clean_fragment(item.get("stock_specific_impact", "")))
+    market = _de_floskel(_clean_fragment(item.get("market_reaction", "")))
+
+    # Ziel: sehr kompakt (1 kurzer Satz), Event zuerst, ohne Doppelpunkt.
+    if stock:
+        text = f"{event}, {stock}"
+    elif direct:
+        text = f"{event}, {direct}"
+    elif market:
+        text = f"{event}, {market}"
+    else:
+        text = str(item.get("causal_chain", "")).strip() or "Kein klarer Grund ableitbar."
+    return _finalize_sentence(_de_floskel(text))
+
+
+def _sentiment_label(sentiment: str) -> str:
+    raw = str(sentiment or "").lower().strip()
+    if raw == "positiv":
+        return "Positiv"
+    if raw == "negativ":
+        return "Negativ"
+    return "Neutral"
+
+
+# Zeilen-Templates einmal definiert; gebundenes str.format statt f-String-Aufbau pro Item.
+_format_top_item = (
+    "🔥 <b>Wichtigster Grund</b>\n"
+    "{text}\n"
+    "<i>({sentiment} {emoji})</i> <a href=\"{link}\">hier nachlesen</a>\n"
+).format
+_format_item = (
+    "• {text}\n"
+    "  <i>({sentiment} {emoji})</i> <a href=\"{link}\">hier nachlesen</a>\n"
+).format
+_format_macro_item = (
+    "• {text}\n"
+    "  <i>({sentiment} {emoji})</i>{source_part}"
+).format
+
+
+def _news_section_to_text(section: Dict[str, Any]) -> str:
+    parts: List[str] = []
+    append = parts.append
     all_empty = True
     for stock, stock_data in section.items():
-        text += f"<b>{stock}</b>\n"
+        append(f"<b>{stock}</b>\n")
         items = stock_data.get("items", [])
         if not items:
             msg = stock_data.get("news_status", {}).get(
                 "message_if_none",
                 "Keine inhaltlich neuen News seit dem letzten Briefing.",
             )
-            text += f"- {msg}\n\n"
+            append(f"- {msg}\n\n")
             continue
 
         all_empty = False
@@ -464,122 +654,106 @@ def _news_section_to_text(section: Dict[str, Any]) -> str:
                 break
         ranked_items = unique_items
         if not ranked_items:
-            text += "- Keine klaren neuen Aussagen.\n\n"
+            append("- Keine klaren neuen Aussagen.\n\n")
             continue
 
         first = ranked_items[0]
-        first_text = _finalize_sentence(_compact_signal_text(first), max_words=15)
-        first_sentiment = _sentiment_label(first.get("sentiment", "neutral"))
-        first_emoji = first.get("emoji", "🟡")
-        first_link = str(first.get("link", "")).strip()
-        text += (
-            "🔥 <b>Wichtigster Grund</b>\n"
-            f"{first_text}\n"
-            f"<i>({first_sentiment} {first_emoji})</i> <a href=\"{first_link}\">hier nachlesen</a>\n"
+        append(
+            _format_top_item(
+                text=_finalize_sentence(_compact_signal_text(first), max_words=15),
+                sentiment=_sentiment_label(first.get("sentiment", "neutral")),
+                emoji=first.get("emoji", NEUTRAL_EMOJI),
+                link=str(first.get("link", "")).strip(),
+            )
         )
 
         for source in ranked_items[1:]:
-            compact = _finalize_sentence(_compact_signal_text(source))
-            sentiment = _sentiment_label(source.get("sentiment", "neutral"))
-            emoji = source.get("emoji", "🟡")
-            link = str(source.get("link", "")).strip()
-            text += (
-                f"• {compact}\n"
-                f"  <i>({sentiment} {emoji})</i> <a href=\"{link}\">hier nachlesen</a>\n"
+            append(
+                _format_item(
+                    text=_finalize_sentence(_compact_signal_text(source)),
+                    sentiment=_sentiment_label(source.get("sentiment", "neutral")),
+                    emoji=source.get("emoji", NEUTRAL_EMOJI),
+                    link=str(source.get("link", "")).strip(),
+                )
             )
-        text += "\n"
+        append("\n")
 
     if all_empty:
-        text += "Heute keine inhaltlich neuen Nachrichten im Beobachtungsuniversum."
-    return text.strip()
+        append("Heute keine inhaltlich neuen Nachrichten im Beobachtungsuniversum.")
+    return "".join(parts).strip()
+
+
+def _is_generic_factor(text: str) -> bool:
+    lower = str(text or "").strip().lower()
+    if not lower:
+        return True
+    generic_markers = (
+        "makro",
+        "marktstimmung",
+        "risiko",
+        "unsicherheit",
+        "märkte steigen",
+        "märkte fallen",
+    )
+    return any(marker in lower for marker in generic_markers)
+
+
+_MACRO_NEGATIVE_MARKERS = ("fällt", "abverkauf", "risk-off", "druck", "belast", "steigt inflation", "zins steigt")
+_MACRO_POSITIVE_MARKERS = ("steigt", "erholt", "risk-on", "entlast", "sinkt inflation", "zins sinkt")
+
+
+def _macro_sentiment_label_and_emoji(factor: Dict[str, Any]) -> tuple[str, str]:
+    reaction = " ".join(
+        [
+            str(factor.get("market_reaction", "")),
+            str(factor.get("macro_impact", "")),
+            str(factor.get("mechanism", "")),
+        ]
+    ).lower()
+    if any(m in reaction for m in _MACRO_NEGATIVE_MARKERS):
+        return "Negativ", NEGATIVE_EMOJI
+    if any(m in reaction for m in _MACRO_POSITIVE_MARKERS):
+        return "Positiv", POSITIVE_EMOJI
+    return "Neutral", NEUTRAL_EMOJI
+
+
+def _macro_interpretation_sentence(
+    factor: Dict[str, Any],
+    event: str,
+    mechanism: str,
+    market_reaction: str,
+    macro_impact: str,
+) -> str:
+    et = str(factor.get("event_type", "other")).lower()
+    joined = " ".join([event, mechanism, macro_impact, market_reaction]).lower()
+    holdings = factor.get("affected_holdings", []) or []
+    holding_tail = ""
+    if holdings:
+        top = ", ".join(holdings[:2])
+        holding_tail = f" und belastet {top}"
+
+    if et in {"geopolitical", "policy"}:
+        if any(k in joined for k in ("iran", "israel", "ukraine", "russia", "krieg", "konflikt", "sanktion")):
+            if any(k in joined for k in ("öl", "oil", "gas", "energie")):
+                return f"{event}, das erhöht Energie- und Inflationsdruck{holding_tail}"
+            return f"{event}, das erhöht das Risiko im Gesamtmarkt{holding_tail}"
+        if any(k in joined for k in ("zoll", "tariff", "handelskonflikt", "trade")):
+            return f"{event}, das erhöht Kosten und bremst Nachfrage{holding_tail}"
+
+    if any(k in joined for k in ("zins", "rate", "yield")):
+        return f"{event}, das verschärft Finanzierungsdruck und belastet Bewertung{holding_tail}"
+    if any(k in joined for k in ("inflation", "preise", "price")):
+        return f"{event}, das erhöht Margendruck und reduziert Kaufkraft{holding_tail}"
+    if market_reaction:
+        return f"{event}, {market_reaction}{holding_tail}"
+    if mechanism:
+        return f"{event}, {mechanism}{holding_tail}"
+    if macro_impact:
+        return f"{event}, {macro_impact}{holding_tail}"
+    return event
 
 
 def _macro_section_to_text(macro_overview: Dict[str, Any]) -> str:
-    def _clean_fragment(text: str) -> str:
-        cleaned = " ".join(str(text or "").split()).strip()
-        return cleaned.rstrip(" .;:!?,")
-
-    def _de_floskel(text: str) -> str:
-        cleaned = str(text or "")
-        cleaned = re.sub(r"\b(könnte|dürfte|wahrscheinlich|tendenziell)\b", "", cleaned, flags=re.IGNORECASE)
-        return " ".join(cleaned.split())
-
-    def _finalize_sentence(text: str) -> str:
-        out = " ".join(str(text or "").replace("...", ".").split()).strip()
-        out = out.rstrip(" .;:!?,")
-        dangling = (" was", " weil", " sodass", " dies führt zu", " und", " oder", " dass")
-        lower = out.lower()
-        if any(lower.endswith(x) for x in dangling):
-            out = out.rsplit(" ", 1)[0].rstrip(" .;:!?,")
-        if not out:
-            return "Keine belastbare Aussage verfügbar."
-        return out + "."
-
-    def _is_generic_factor(text: str) -> bool:
-        lower = str(text or "").strip().lower()
-        if not lower:
-            return True
-        generic_markers = (
-            "makro",
-            "marktstimmung",
-            "risiko",
-            "unsicherheit",
-            "märkte steigen",
-            "märkte fallen",
-        )
-        return any(marker in lower for marker in generic_markers)
-
-    def _macro_sentiment_label_and_emoji(factor: Dict[str, Any]) -> tuple[str, str]:
-        reaction = " ".join(
-            [
-                str(factor.get("market_reaction", "")),
-                str(factor.get("macro_impact", "")),
-                str(factor.get("mechanism", "")),
-            ]
-        ).lower()
-        negative_markers = ("fällt", "abverkauf", "risk-off", "druck", "belast", "steigt inflation", "zins steigt")
-        positive_markers = ("steigt", "erholt", "risk-on", "entlast", "sinkt inflation", "zins sinkt")
-        if any(m in reaction for m in negative_markers):
-            return "Negativ", "🔴"
-        if any(m in reaction for m in positive_markers):
-            return "Positiv", "🟢"
-        return "Neutral", "🟡"
-
-    def _macro_interpretation_sentence(
-        factor: Dict[str, Any],
-        event: str,
-        mechanism: str,
-        market_reaction: str,
-        macro_impact: str,
-    ) -> str:
-        et = str(factor.get("event_type", "other")).lower()
-        joined = " ".join([event, mechanism, macro_impact, market_reaction]).lower()
-        holdings = factor.get("affected_holdings", []) or []
-        holding_tail = ""
-        if holdings:
-            top = ", ".join(holdings[:2])
-            holding_tail = f" und belastet {top}"
-
-        if et in {"geopolitical", "policy"}:
-            if any(k in joined for k in ("iran", "israel", "ukraine", "russia", "krieg", "konflikt", "sanktion")):
-                if any(k in joined for k in ("öl", "oil", "gas", "energie")):
-                    return f"{event}, das erhöht Energie- und Inflationsdruck{holding_tail}"
-                return f"{event}, das erhöht das Risiko im Gesamtmarkt{holding_tail}"
-            if any(k in joined for k in ("zoll", "tariff", "handelskonflikt", "trade")):
-                return f"{event}, das erhöht Kosten und bremst Nachfrage{holding_tail}"
-
-        if any(k in joined for k in ("zins", "rate", "yield")):
-            return f"{event}, das verschärft Finanzierungsdruck und belastet Bewertung{holding_tail}"
-        if any(k in joined for k in ("inflation", "preise", "price")):
-            return f"{event}, das erhöht Margendruck und reduziert Kaufkraft{holding_tail}"
-        if market_reaction:
-            return f"{event}, {market_reaction}{holding_tail}"
-        if mechanism:
-            return f"{event}, {mechanism}{holding_tail}"
-        if macro_impact:
-            return f"{event}, {macro_impact}{holding_tail}"
-        return event
-
     factors = macro_overview.get("factors", [])
     if not factors:
         return macro_overview.get("summary", "Keine dominanten neuen Marktfaktoren erkannt.")
@@ -606,10 +780,7 @@ def _macro_section_to_text(macro_overview: Dict[str, Any]) -> str:
         source_url = str(source_links[0]).strip() if source_links else ""
         source_part = f' <a href="{source_url}">hier nachlesen</a>' if source_url else ""
         sentiment, emoji = _macro_sentiment_label_and_emoji(factor)
-        lines.append(
-            f"• {compact}\n"
-            f"  <i>({sentiment} {emoji})</i>{source_part}"
-        )
+        lines.append(_format_macro_item(text=compact, sentiment=sentiment, emoji=emoji, source_part=source_part))
     return "\n".join(lines).strip()
 
 
@@ -671,28 +842,16 @@ def prepare_briefing_payload() -> Dict[str, Any]:
     novelty_cfg = _novelty_config(settings)
     ranking_cfg = _ranking_config(settings, novelty_cfg)
 
-    memory = load_memory()
-    memory = prune_memory(memory, int(novelty_cfg.get("memory_retention_days", 90)))
-
     pf_items = settings["portfolio"]
     wl_items = settings["watchlist"]
 
-    logger.info("💹 Hole Kursdaten…")
-    pf_data, date = get_price_changes(pf_items)
-    wl_data, _ = get_price_changes(wl_items)
-    pf_fmt = [format_stock(s) for s in pf_data]
-    wl_fmt = [format_stock(s) for s in wl_data]
-    change_map = _price_map(pf_fmt + wl_fmt)
-
-    logger.info("📰 Starte News-Pipeline (Fetch -> Ranking -> Analyse)…")
-    (news_pf, pending_pf), (news_wl, pending_wl) = asyncio.run(
-        gather_news_parallel(
+    pf_fmt, wl_fmt, date, memory, ((news_pf, pending_pf), (news_wl, pending_wl)) = _run_async(
+        gather_briefing_inputs(
             portfolio_items=pf_items,
             watchlist_items=wl_items,
-            memory=memory,
             novelty_cfg=novelty_cfg,
             ranking_cfg=ranking_cfg,
-            price_change_map=change_map,
+            max_workers=int(settings.get("performance", {}).get("max_concurrent_tasks", 5)),
         )
     )
 
@@ -721,16 +880,8 @@ def prepare_briefing_payload() -> Dict[str, Any]:
         "ranking_config": ranking_cfg,
     }
 
-    archive_entry = {
-        "date": date,
-        "portfolio": pf_fmt,
-        "watchlist": wl_fmt,
-        "news": news_bundle,
-        "macro_overview": macro_overview,
-        "novelty_stats": novelty_stats,
-        "ranking_config": ranking_cfg,
-        "version": "2.0.0",
-    }
+    # Archiv teilt sich alle Strukturen per Referenz mit dem Report (keine Kopie der News).
+    archive_entry = {**report_data, "version": "2.0.0"}
 
     if novelty_cfg.get("include_known_news_reason_in_report", True):
         archive_entry["suppressed_known_topics"] = suppressed_known_topics
@@ -759,12 +910,19 @@ def run_briefing_test(send_telegram=True):
     logger.info("📊 Starte Aktienbriefing…")
     payload = prepare_briefing_payload()
 
-    if send_telegram:
-        send_briefing_blocks(payload["blocks"])
-        persist_prepared_memory(payload)
+    # Report und Archiv sind reine Datei-Writes und laufen parallel zum Telegram-Versand.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="briefing-io") as pool:
+        side_jobs = [
+            pool.submit(render_report, payload["report_data"]),
+            pool.submit(archive_briefing, payload["archive_entry"]),
+        ]
+
+        if send_telegram:
+            send_briefing_blocks(payload["blocks"])
+            persist_prepared_memory(payload)
 
-    render_report(payload["report_data"])
-    archive_briefing(payload["archive_entry"])
+        for job in side_jobs:
+            job.result()
 
     logger.info("✅ Briefing abgeschlossen.")
     return True
@@ -1,7 +1,24 @@
 import feedparser
 import asyncio
+import httpx
+import time
+from itertools import islice
 from loguru import logger
-from urllib.parse import quote_plus
+from typing import Dict, Optional
+from urllib.parse import quote_plus, urlsplit
+
+# lxml (libxml2) parst RSS 2.0 deutlich schneller als feedparser;
+# feedparser bleibt Fallback für Atom und fehlerhaftes XML.
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from config.settings_loader import load_settings
+from utils.cache import get_cache, set_cache
+from utils.http_client import get_http_client
 from utils.preprocess import clean_title, remove_boilerplate, limit_length
 
 # ================================================================
@@ -13,30 +30,198 @@ SOURCES = [
     "https://www.bing.com/news/search?q={query}+stock&format=rss"
 ]
 
+MAX_ENTRIES_PER_FEED = 5  # harte Begrenzung für Speed & Kosten
+
+# Obergrenze gleichzeitiger Feed-Requests über alle Aktien hinweg
+# (Höflichkeit gegenüber den Feed-Anbietern statt fester Pausen).
+FEED_CONCURRENCY = 10
+
+_feed_semaphore: Optional[asyncio.Semaphore] = None
+_feed_semaphore_loop = None
+
+
+def _get_feed_semaphore() -> asyncio.Semaphore:
+    """Semaphore pro Event-Loop, analog zum gemeinsamen HTTP-Client."""
+    global _feed_semaphore, _feed_semaphore_loop
+    current_loop = asyncio.get_running_loop()
+
+    if _feed_semaphore is None or _feed_semaphore_loop is not current_loop:
+        _feed_semaphore = asyncio.Semaphore(FEED_CONCURRENCY)
+        _feed_semaphore_loop = current_loop
+
+    return _feed_semaphore
+
+
+# Zusätzlich pro Host ein Token-Bucket, damit z.B. Google News bei vielen
+# Aktien nicht in kurzer Folge getroffen wird (performance.feed_requests_per_second).
+DEFAULT_FEED_REQUESTS_PER_SECOND = 5.0
+
+_host_limiters: Dict[str, "HostRateLimiter"] = {}
+_host_limiters_loop = None
+
+
+class HostRateLimiter:
+    """Token-Bucket mit rate Requests/Sekunde und Burst in gleicher Höhe."""
+
+    def __init__(self, rate: float):
+        self._rate = max(0.1, float(rate))
+        self._tokens = self._rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
+def _get_host_limiter(url: str) -> HostRateLimiter:
+    global _host_limiters_loop
+    current_loop = asyncio.get_running_loop()
+
+    if _host_limiters_loop is not current_loop:
+        _host_limiters.clear()
+        _host_limiters_loop = current_loop
+
+    host = urlsplit(url).hostname or ""
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        perf = load_settings().get("performance", {}) or {}
+        limiter = HostRateLimiter(perf.get("feed_requests_per_second", DEFAULT_FEED_REQUESTS_PER_SECOND))
+        _host_limiters[host] = limiter
+    return limiter
+
 
 # ================================================================
 # Einzelne Quelle abrufen
 # ================================================================
-def fetch_source(url: str):
-    feed = feedparser.parse(url)
-    results = []
+def _build_article(title, content, link, published_at, source_name, source_url) -> dict:
+    return {
+        "title": clean_title(title),
+        "content": limit_length(remove_boilerplate(content)),
+        "link": link,
+        "published_at": published_at,
+        "source_name": source_name,
+        "source_url": source_url,
+    }
+
+
+def parse_feed(feed) -> list:
     source_name = feed.feed.get("title", "")
     source_url = feed.feed.get("link", "")
 
-    for e in feed.entries[:5]:  # harte Begrenzung für Speed & Kosten
-        content = e.get("summary", "") or e.get("description", "")
+    # Einträge ohne Titel/Link überspringen statt den ganzen Feed zu verwerfen.
+    return list(
+        islice(
+            (
+                _build_article(
+                    title,
+                    e.get("summary", "") or e.get("description", ""),
+                    link,
+                    e.get("published", "") or e.get("updated", ""),
+                    source_name,
+                    source_url,
+                )
+                for e in feed.entries
+                if (title := e.get("title")) and (link := e.get("link"))
+            ),
+            MAX_ENTRIES_PER_FEED,
+        )
+    )
+
+
+def parse_rss_fast(content: bytes) -> Optional[list]:
+    """RSS 2.0 per lxml parsen; None signalisiert den Fallback auf feedparser."""
+    if not LXML_AVAILABLE:
+        return None
+
+    try:
+        parser = etree.XMLParser(resolve_entities=False, no_network=True)
+        root = etree.fromstring(content, parser=parser)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+    channel = root.find("channel") if root.tag == "rss" else None
+    if channel is None:
+        return None
+
+    source_name = (channel.findtext("title") or "").strip()
+    source_url = (channel.findtext("link") or "").strip()
+
+    return list(
+        islice(
+            (
+                _build_article(
+                    title,
+                    (item.findtext("description") or "").strip(),
+                    link,
+                    (item.findtext("pubDate") or "").strip(),
+                    source_name,
+                    source_url,
+                )
+                for item in channel.iterfind("item")
+                if (title := (item.findtext("title") or "").strip())
+                and (link := (item.findtext("link") or "").strip())
+            ),
+            MAX_ENTRIES_PER_FEED,
+        )
+    )
+
+
+def _parse_response(content: bytes, content_type: str) -> list:
+    articles = parse_rss_fast(content)
+    if articles is not None:
+        return articles
+    feed = feedparser.parse(content, response_headers={"content-type": content_type})
+    return parse_feed(feed)
+
+
+async def fetch_source(url: str):
+    """Lädt den Feed über den gemeinsamen httpx-Client, geparst wird im Thread (lxml, sonst feedparser)."""
+    # Conditional GET: unveränderte Feeds liefern 304 ohne Body,
+    # dann werden die zuletzt geparsten Artikel wiederverwendet.
+    cache_key = f"feed::{url}"
+    cached = get_cache(cache_key)
+    headers = {}
+    if isinstance(cached, dict):
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        await _get_host_limiter(url).acquire()
+        async with _get_feed_semaphore():
+            response = await get_http_client().get(url, headers=headers)
+        if response.status_code == 304 and isinstance(cached, dict):
+            # Zeitstempel auffrischen, damit aktive Feeds nicht aus dem Cache fallen.
+            set_cache(cache_key, {**cached, "ts": time.time()})
+            return cached.get("articles") or []
+        response.raise_for_status()
+    except httpx.HTTPError as exc:
+        logger.warning(f"Feed nicht erreichbar ({url}): {exc}")
+        return []
 
-        article = {
-            "title": clean_title(e.title),
-            "content": limit_length(remove_boilerplate(content)),
-            "link": e.link,
-            "published_at": e.get("published", "") or e.get("updated", ""),
-            "source_name": source_name,
-            "source_url": source_url,
-        }
-        results.append(article)
+    articles = await asyncio.to_thread(
+        _parse_response,
+        response.content,
+        response.headers.get("content-type", ""),
+    )
 
-    return results
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if etag or last_modified:
+        set_cache(
+            cache_key,
+            {"ts": time.time(), "etag": etag, "last_modified": last_modified, "articles": articles},
+        )
+    return articles
 
 
 # ================================================================
@@ -52,7 +237,7 @@ async def fetch_all_sources(name: str):
     urls = [src.format(query=encoded_query) for src in SOURCES]
 
     # Parsen parallel ausführen
-    tasks = [asyncio.to_thread(fetch_source, url) for url in urls]
+    tasks = [fetch_source(url) for url in urls]
     results_per_source = await asyncio.gather(*tasks)
 
     # Flach machen
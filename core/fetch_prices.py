@@ -1,11 +1,14 @@
 import yfinance as yf
 from loguru import logger
-from pydantic import BaseModel
-from typing import List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
+RECENT_PERIOD = "10d"
 
-class StockChange(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class StockChange:
     symbol: str      # Name für die Ausgabe
     ticker: str
     change_percent: float
@@ -62,20 +65,71 @@ def _resolve_watchlist_entry_close(ticker_obj, item: dict, recent_data) -> Optio
     return None
 
 
-def get_price_changes(items: List[dict]) -> Tuple[List[StockChange], Optional[str]]:
+def _download_recent(symbols: List[str]) -> Dict[str, object]:
+    """
+    Holt die letzten Tageskurse aller Ticker in einem yf.download-Aufruf
+    (yfinance verteilt intern auf Threads). Fehlende Ticker fehlen im Ergebnis.
+    """
+    if not symbols:
+        return {}
+
+    try:
+        frame = yf.download(
+            tickers=" ".join(symbols),
+            period=RECENT_PERIOD,
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+    except Exception as e:
+        logger.warning(f"Sammel-Download der Kurse fehlgeschlagen: {e}")
+        return {}
+
+    if frame is None or len(frame) == 0:
+        return {}
+
+    recent = {}
+    columns = frame.columns
+    tickers_in_frame = set(columns.get_level_values(0)) if getattr(columns, "nlevels", 1) > 1 else None
+    for symbol in symbols:
+        try:
+            if tickers_in_frame is None:
+                data = frame if len(symbols) == 1 else None
+            else:
+                data = frame[symbol] if symbol in tickers_in_frame else None
+            if data is not None:
+                data = data.dropna(subset=["Close"])
+                if len(data) > 0:
+                    recent[symbol] = data
+        except Exception:
+            continue
+    return recent
+
+
+def get_price_changes(
+    items: List[dict],
+    recent_by_symbol: Optional[Dict[str, object]] = None,
+) -> Tuple[List[StockChange], Optional[str]]:
     """
     Holt Kursänderungen (in %) basierend auf dem TICKER.
     items = [{ticker: "...", name: "..."}]
+    recent_by_symbol: bereits geladene Tageskurse (siehe get_price_changes_for_lists)
     """
     results = []
     last_trading_day = None
+    if recent_by_symbol is None:
+        recent_by_symbol = _download_recent([item["ticker"] for item in items])
 
     for item in items:
         ticker_symbol = item["ticker"]
         name = item["name"]
         try:
             ticker = yf.Ticker(ticker_symbol)
-            data = ticker.history(period="10d", interval="1d").dropna(subset=["Close"])
+            data = recent_by_symbol.get(ticker_symbol)
+            if data is None:
+                # Fallback: Ticker fehlt in der Sammel-Antwort -> einzeln abrufen.
+                data = ticker.history(period=RECENT_PERIOD, interval="1d").dropna(subset=["Close"])
             watchlist_added_close = _resolve_watchlist_entry_close(ticker, item, data)
 
             if len(data) < 2:
@@ -94,10 +148,10 @@ def get_price_changes(items: List[dict]) -> Tuple[List[StockChange], Optional[st
                 StockChange(
                     symbol=name,                   # Name statt ticker für Anzeige
                     ticker=ticker_symbol,
-                    change_percent=round(change, 2),
+                    change_percent=round(float(change), 2),
                     last_trading_day=last_date,
                     since_watchlist_percent=(
-                        round(((last_close - watchlist_added_close) / watchlist_added_close) * 100, 2)
+                        round(float((last_close - watchlist_added_close) / watchlist_added_close) * 100, 2)
                         if watchlist_added_close not in (None, 0.0)
                         else None
                     ),
@@ -112,3 +166,19 @@ def get_price_changes(items: List[dict]) -> Tuple[List[StockChange], Optional[st
         logger.warning("Konnte kein Handelsdatum bestimmen.")
 
     return results, last_trading_day
+
+
+def get_price_changes_for_lists(
+    portfolio_items: List[dict],
+    watchlist_items: List[dict],
+) -> Tuple[Tuple[List[StockChange], Optional[str]], Tuple[List[StockChange], Optional[str]]]:
+    """
+    Portfolio und Watchlist mit einem gemeinsamen Download: Ticker, die in
+    beiden Listen stehen, werden nur einmal bei Yahoo abgefragt.
+    """
+    symbols = list(dict.fromkeys(item["ticker"] for item in [*portfolio_items, *watchlist_items]))
+    recent_by_symbol = _download_recent(symbols)
+    return (
+        get_price_changes(portfolio_items, recent_by_symbol),
+        get_price_changes(watchlist_items, recent_by_symbol),
+    )
@@ -1,4 +1,6 @@
-from typing import Any, Dict, List
+import heapq
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Tuple
 
 
 MACRO_EVENT_TYPES = {"geopolitical", "macro", "policy", "commodity"}
@@ -46,51 +48,58 @@ def _is_macro_signal(signal: Dict[str, Any]) -> bool:
     return any(k in text for k in keywords)
 
 
+def _iter_signals(news_bundle: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Liefert (Aktie, Signal) über Portfolio und Watchlist, ohne Zwischenliste."""
+    for section in ("portfolio", "watchlist"):
+        for stock_name, stock_data in news_bundle.get(section, {}).items():
+            for signal in stock_data.get("items", []):
+                yield stock_name, signal
+
+
 def build_macro_overview(
     portfolio_items: List[Dict[str, Any]],
     watchlist_items: List[Dict[str, Any]],
     news_bundle: Dict[str, Any],
 ) -> Dict[str, Any]:
-    all_items = list(portfolio_items) + list(watchlist_items)
-    exposure_map = {str(item.get("name", "")): _infer_sector(item) for item in all_items}
+    exposure_map = {
+        str(item.get("name", "")): _infer_sector(item) for item in chain(portfolio_items, watchlist_items)
+    }
 
     grouped: Dict[str, Dict[str, Any]] = {}
-    for section in ("portfolio", "watchlist"):
-        section_data = news_bundle.get(section, {})
-        for stock_name, stock_data in section_data.items():
-            for signal in stock_data.get("items", []):
-                if not _is_macro_signal(signal):
-                    continue
-                key = str(signal.get("event", "")).strip().lower()
-                if not key:
-                    continue
-                if key not in grouped:
-                    grouped[key] = {
-                        "factor": signal.get("event", ""),
-                        "mechanism": signal.get("direct_effect", ""),
-                        "macro_impact": signal.get("macro_impact", ""),
-                        "market_reaction": signal.get("market_reaction", ""),
-                        "event_types": set(),
-                        "affected_sectors": set(signal.get("affected_sectors", []) or []),
-                        "affected_holdings": set(),
-                        "sources": [],
-                        "weight": 0.0,
-                        "confidence": signal.get("confidence", "medium"),
-                        "time_horizon": signal.get("time_horizon", "short"),
-                    }
-                grouped[key]["weight"] += _safe_float(signal.get("impact_score", 0)) * 0.6 + _safe_float(
-                    signal.get("relevance_score", 0)
-                ) * 0.4
-                grouped[key]["event_types"].add(str(signal.get("event_type", "other")).lower())
-                grouped[key]["affected_holdings"].add(stock_name)
-                link = str(signal.get("link", "")).strip()
-                if link and link not in grouped[key]["sources"]:
-                    grouped[key]["sources"].append(link)
-                stock_sector = exposure_map.get(stock_name, "Unknown")
-                if stock_sector != "Unknown":
-                    grouped[key]["affected_sectors"].add(stock_sector)
-
-    factors = sorted(grouped.values(), key=lambda x: x["weight"], reverse=True)[:3]
+    for stock_name, signal in _iter_signals(news_bundle):
+        if not _is_macro_signal(signal):
+            continue
+        key = str(signal.get("event", "")).strip().lower()
+        if not key:
+            continue
+        if key not in grouped:
+            grouped[key] = {
+                "factor": signal.get("event", ""),
+                "mechanism": signal.get("direct_effect", ""),
+                "macro_impact": signal.get("macro_impact", ""),
+                "market_reaction": signal.get("market_reaction", ""),
+                "event_types": set(),
+                "affected_sectors": set(signal.get("affected_sectors", []) or []),
+                "affected_holdings": set(),
+                "sources": [],
+                "weight": 0.0,
+                "confidence": signal.get("confidence", "medium"),
+                "time_horizon": signal.get("time_horizon", "short"),
+            }
+        grouped[key]["weight"] += _safe_float(signal.get("impact_score", 0)) * 0.6 + _safe_float(
+            signal.get("relevance_score", 0)
+        ) * 0.4
+        grouped[key]["event_types"].add(str(signal.get("event_type", "other")).lower())
+        grouped[key]["affected_holdings"].add(stock_name)
+        link = str(signal.get("link", "")).strip()
+        if link and link not in grouped[key]["sources"]:
+            grouped[key]["sources"].append(link)
+        stock_sector = exposure_map.get(stock_name, "Unknown")
+        if stock_sector != "Unknown":
+            grouped[key]["affected_sectors"].add(stock_sector)
+
+    # Top 3 ohne komplette Sortierung aller Faktoren.
+    factors = heapq.nlargest(3, grouped.values(), key=lambda x: x["weight"])
     normalized = []
     for factor in factors:
         normalized.append(
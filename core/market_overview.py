@@ -1,14 +1,15 @@
-from openai import OpenAI
-from dotenv import load_dotenv
 from loguru import logger
-from utils.prompt_loader import load_prompt
+from utils.openai_client import get_sync_client
+from utils.prompt_loader import load_prompt, render_prompt
 
 import re
-import os
 
-load_dotenv()
-
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Vorkompilierte Muster für das Parsen der GPT-Antwort
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# Ein Split-Durchlauf statt drei Suchen: [prefix, label1, body1, label2, body2, ...]
+_SECTION_SPLIT_RE = re.compile(r"(makro:|portfolio:|gesamteinschätzung:)", re.IGNORECASE)
+_EMOJI_RE = re.compile(r"(🟢|🟡|🔴|⚪️|⚫️)")
 
 
 def strip_markdown_from_summary(text: str) -> str:
@@ -16,16 +17,12 @@ def strip_markdown_from_summary(text: str) -> str:
     if not text:
         return text
     # Entfernt ** ... **, lässt andere Markdown-Zeichen intakt
-    cleaned = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
+    cleaned = _BOLD_RE.sub(r"\1", text)
     # Überflüssige Leerzeilen normalisieren
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _BLANK_LINES_RE.sub("\n\n", cleaned)
     return cleaned.strip()
 
 
-
-
-
-
 def generate_market_overview(portfolio_data, summaries):
     """
     Erzeugt eine GPT-gestützte Marktanalyse mit Makro-, Portfolio- und Gesamteinschätzung.
@@ -36,19 +33,18 @@ def generate_market_overview(portfolio_data, summaries):
         # STAGE 4 FIX:
         # Name-only Ausgabe, kein Ticker, kein Klammerformat mehr
         # -----------------------------
-        kursdaten = ", ".join(
-            [f"{s.symbol}: {s.change_percent:+.2f}%" for s in portfolio_data]
-        )
+        kursdaten = ", ".join(f"{s.symbol}: {s.change_percent:+.2f}%" for s in portfolio_data)
         # ------------------------------
 
+        # summaries darf ein beliebiges Iterable (z.B. Generator) sein.
         joined_summaries = "\n".join(summaries)
 
         # Prompt laden und formatieren
-        prompt = load_prompt("market_overview").format(
-            kursdaten=kursdaten, summaries=joined_summaries
+        prompt = render_prompt(
+            "market_overview", {"kursdaten": kursdaten, "summaries": joined_summaries}
         )
 
-        response = client.chat.completions.create(
+        response = get_sync_client().chat.completions.create(
             model="gpt-4.1-mini",
             messages=[
                 {"role": "system", "content": load_prompt("system_analyst")},
@@ -71,15 +67,17 @@ def generate_market_overview(portfolio_data, summaries):
 
 def parse_market_overview(text: str):
     """Parst GPT-Antwort in Makro-, Portfolio- und Gesamteinschätzung."""
-    macro_match = re.search(r"(?i)makro:\s*(.*?)(?:portfolio:|gesamteinschätzung:|$)", text, re.S)
-    portfolio_match = re.search(r"(?i)portfolio:\s*(.*?)(?:gesamteinschätzung:|$)", text, re.S)
-    final_match = re.search(r"(?i)gesamteinschätzung:\s*(.*)", text, re.S)
+    parts = _SECTION_SPLIT_RE.split(text)
+    sections = {}
+    for label, body in zip(parts[1::2], parts[2::2]):
+        # Erstes Vorkommen eines Labels gewinnt (wie zuvor bei re.search).
+        sections.setdefault(label.lower(), body.strip())
 
-    macro = macro_match.group(1).strip() if macro_match else "(keine Daten)"
-    portfolio = portfolio_match.group(1).strip() if portfolio_match else "(keine Daten)"
-    final_text = final_match.group(1).strip() if final_match else "(keine Daten)"
+    macro = sections.get("makro:", "(keine Daten)")
+    portfolio = sections.get("portfolio:", "(keine Daten)")
+    final_text = sections.get("gesamteinschätzung:", "(keine Daten)")
 
-    emoji_match = re.search(r"(🟢|🟡|🔴|⚪️|⚫️)", final_text)
+    emoji_match = _EMOJI_RE.search(final_text)
     emoji = emoji_match.group(1) if emoji_match else "🟡"
 
     return {
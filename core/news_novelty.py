@@ -1,38 +1,28 @@
 import asyncio
 import hashlib
-import os
 from typing import Any, Dict, List, Optional
 
-from dotenv import load_dotenv
 from loguru import logger
-from openai import AsyncOpenAI
 
+from utils.cache import get_cached_embeddings, set_cached_embeddings
 from utils.news_memory import (
     build_title_fingerprint,
     canonicalize_url,
     entries_for_stock,
-    find_semantic_match,
-    is_exact_duplicate,
+    find_semantic_matches,
     normalize_text,
+    normalized_matrix,
 )
+from utils.openai_client import call_with_retries, get_async_client
 
-load_dotenv()
-
-_embedding_client = None
-_embedding_client_loop = None
 _embedding_semaphore = None
 _embedding_semaphore_loop = None
 _EMBEDDING_BATCH_SIZE = 32
 _EMBEDDING_MODEL = "text-embedding-3-small"
-
-
-def _get_embedding_client() -> AsyncOpenAI:
-    global _embedding_client, _embedding_client_loop
-    loop = asyncio.get_running_loop()
-    if _embedding_client is None or _embedding_client_loop is not loop:
-        _embedding_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        _embedding_client_loop = loop
-    return _embedding_client
+# 512 statt 1536 Dimensionen reichen für Cosine-Dedupe (Schwelle 0.86) und
+# verkleinern Payload, Matmuls und news_memory.npz. Ältere 1536er-Vektoren im
+# Memory werden beim Abgleich gekürzt (Matryoshka-Eigenschaft von text-embedding-3).
+_EMBEDDING_DIMENSIONS = 512
 
 
 def _get_embedding_semaphore(max_concurrent: int = 3) -> asyncio.Semaphore:
@@ -50,28 +40,79 @@ def _embedding_input(article: Dict[str, Any]) -> str:
     return normalize_text(f"{title}\n{content[:1000]}")
 
 
+def _embedding_cache_key(text: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{_EMBEDDING_MODEL}:{_EMBEDDING_DIMENSIONS}:{digest}"
+
+
 async def _embed_texts(texts: List[str]) -> Optional[List[List[float]]]:
+    """Embeddings mit persistentem Cache: nur unbekannte Texte gehen an die API."""
     if not texts:
         return []
-    try:
-        vectors: List[List[float]] = []
-        client = _get_embedding_client()
-        semaphore = _get_embedding_semaphore()
-
-        for idx in range(0, len(texts), _EMBEDDING_BATCH_SIZE):
-            batch = texts[idx:idx + _EMBEDDING_BATCH_SIZE]
-            async with semaphore:
-                response = await client.embeddings.create(
+
+    keys = [_embedding_cache_key(text) for text in texts]
+    cached = get_cached_embeddings(keys)
+    missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in cached))
+    if missing:
+        vectors = await _embed_uncached(missing)
+        if vectors is None:
+            return None
+        fresh = {_embedding_cache_key(text): vector for text, vector in zip(missing, vectors)}
+        set_cached_embeddings(fresh)
+        cached.update(fresh)
+    return [cached.get(key) or [] for key in keys]
+
+
+async def _embed_uncached(texts: List[str]) -> Optional[List[List[float]]]:
+    async def _embed_batch(batch: List[str]) -> List[List[float]]:
+        async with _get_embedding_semaphore():
+            response = await call_with_retries(
+                lambda: get_async_client().embeddings.create(
                     model=_EMBEDDING_MODEL,
                     input=batch,
+                    dimensions=_EMBEDDING_DIMENSIONS,
                 )
-            vectors.extend([item.embedding for item in response.data])
-        return vectors
+            )
+        return [item.embedding for item in response.data]
+
+    try:
+        # Batches laufen parallel (Semaphore begrenzt); Reihenfolge bleibt über die Task-Liste erhalten.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_embed_batch(texts[idx:idx + _EMBEDDING_BATCH_SIZE]))
+                for idx in range(0, len(texts), _EMBEDDING_BATCH_SIZE)
+            ]
+        return [vector for task in tasks for vector in task.result()]
     except Exception as exc:
         logger.warning(f"Embedding-Fehler, falle auf Exact-Dedupe zurück: {exc}")
         return None
 
 
+async def prefetch_embeddings(articles: List[Dict[str, Any]]) -> int:
+    """
+    Bettet alle Artikel (z.B. über Portfolio + Watchlist hinweg) in einer
+    gemeinsamen Embedding-Call-Kette ein und hängt das Ergebnis als
+    _novelty_embedding an. filter_news_by_novelty nutzt diese Vektoren dann
+    statt pro Aktie eigene Requests abzusetzen.
+    """
+    pending = [a for a in articles if not a.get("_novelty_embedding")]
+    if not pending:
+        return 0
+
+    # Gleiche Texte (syndizierte Artikel) nur einmal einbetten.
+    inputs = [_embedding_input(a) for a in pending]
+    unique_inputs = list(dict.fromkeys(inputs))
+    vectors = await _embed_texts(unique_inputs)
+    if not vectors:
+        return 0
+
+    by_text = dict(zip(unique_inputs, vectors))
+    for article, text in zip(pending, inputs):
+        article["_novelty_embedding"] = by_text.get(text) or []
+    logger.info(f"Embeddings vorab berechnet: {len(unique_inputs)} Texte für {len(pending)} Artikel.")
+    return len(unique_inputs)
+
+
 async def filter_news_by_novelty(
     stock_name: str,
     raw_articles: List[Dict[str, Any]],
@@ -95,24 +136,38 @@ async def filter_news_by_novelty(
     candidates: List[Dict[str, Any]] = []
     suppressed_known_topics: List[Dict[str, Any]] = []
 
-    seen_url_hashes = set()
+    # Innerhalb des Laufs reicht die kanonische URL als Set-Key; der SHA-256
+    # wird nur für den Abgleich mit den persistierten Memory-Hashes gebraucht.
+    seen_urls = set()
     seen_title_fingerprints = set()
+    # Memory-Abgleich einmal als Sets statt pro Artikel linear über stock_entries.
+    memory_url_hashes = (
+        {e["canonical_url_hash"] for e in stock_entries if e.get("canonical_url_hash")}
+        if exact_url_dedupe
+        else set()
+    )
+    memory_title_fingerprints = (
+        {e["title_fingerprint"] for e in stock_entries if e.get("title_fingerprint")}
+        if exact_title_dedupe
+        else set()
+    )
 
     for article in raw_articles:
         canonical_url = canonicalize_url(article.get("link", ""))
-        url_hash = hashlib.sha256(canonical_url.encode("utf-8")).hexdigest() if canonical_url else ""
         title_fp = build_title_fingerprint(article.get("title", ""))
 
         exact_duplicate_in_run = (
-            (exact_url_dedupe and url_hash and url_hash in seen_url_hashes)
+            (exact_url_dedupe and canonical_url and canonical_url in seen_urls)
             or (exact_title_dedupe and title_fp and title_fp in seen_title_fingerprints)
         )
-        exact_duplicate_in_memory = is_exact_duplicate(
-            stock_entries,
-            url_hash,
-            title_fp,
-            exact_url_dedupe=exact_url_dedupe,
-            exact_title_dedupe=exact_title_dedupe,
+        # SHA-256 erst berechnen, wenn billigere Checks nicht schon greifen.
+        exact_duplicate_in_memory = not exact_duplicate_in_run and (
+            (title_fp and title_fp in memory_title_fingerprints)
+            or (
+                canonical_url
+                and memory_url_hashes
+                and hashlib.sha256(canonical_url.encode("utf-8")).hexdigest() in memory_url_hashes
+            )
         )
 
         if exact_duplicate_in_run or exact_duplicate_in_memory:
@@ -124,11 +179,8 @@ async def filter_news_by_novelty(
             })
             continue
 
-        seen_url_hashes.add(url_hash)
+        seen_urls.add(canonical_url)
         seen_title_fingerprints.add(title_fp)
-
-        article["_canonical_url_hash"] = url_hash
-        article["_title_fingerprint"] = title_fp
         candidates.append(article)
 
     if not candidates:
@@ -139,31 +191,51 @@ async def filter_news_by_novelty(
             "candidate_embeddings": [],
         }
 
-    embed_inputs = [_embedding_input(a) for a in candidates]
-    embeddings = await _embed_texts(embed_inputs)
+    # Embeddings als Spalte parallel zu candidates: vorab berechnete Vektoren
+    # (prefetch_embeddings) wiederverwenden, nur fehlende nachholen. An die
+    # Artikel-Dicts wird erst am Ende für die übrig gebliebenen neuen Items geschrieben.
+    embeddings = [a.get("_novelty_embedding") or [] for a in candidates]
+    missing_rows = [idx for idx, vector in enumerate(embeddings) if not vector]
+    if missing_rows:
+        vectors = await _embed_texts([_embedding_input(candidates[idx]) for idx in missing_rows])
+        if vectors:
+            for idx, vector in zip(missing_rows, vectors):
+                embeddings[idx] = vector
+    if not any(embeddings):
+        embeddings = None
+
+    # Alle Kandidaten in einem Matmul gegen das Memory der Aktie prüfen.
+    memory_matches = (
+        find_semantic_matches(
+            stock_entries,
+            embeddings,
+            semantic_threshold,
+            matrix_cache=memory.setdefault("_embedding_cache", {}),
+        )
+        if embeddings
+        else [None] * len(candidates)
+    )
+
+    # Abgleich innerhalb des Laufs: alle paarweisen Similarities in einem
+    # GEMM (n x n) vorab, der greedy Durchlauf liest dann nur noch Zeilen.
+    dim = next((len(v) for v in embeddings if v), 0) if embeddings else 0
+    if dim:
+        candidate_matrix = normalized_matrix(embeddings, dim)
+        run_similarities = candidate_matrix @ candidate_matrix.T
+    else:
+        run_similarities = None
 
     new_items: List[Dict[str, Any]] = []
-    new_item_embeddings: List[List[float]] = []
-    known_semantic_embeddings: List[List[float]] = []
+    has_new_item_embedding = False
+    seen_rows: List[int] = []  # neue + semantisch unterdrückte Kandidaten mit Embedding
 
     for idx, article in enumerate(candidates):
         candidate_embedding = embeddings[idx] if embeddings else None
-
-        semantic_match_memory = find_semantic_match(
-            stock_entries,
-            candidate_embedding,
-            semantic_threshold,
-        ) if embeddings else None
+        semantic_match_memory = memory_matches[idx]
 
         semantic_match_run = None
-        if embeddings and candidate_embedding and new_item_embeddings:
-            best_score = 0.0
-            for emb in new_item_embeddings + known_semantic_embeddings:
-                # local import to avoid duplicate utility functions
-                from utils.news_memory import cosine_similarity
-                score = cosine_similarity(candidate_embedding, emb)
-                if score > best_score:
-                    best_score = score
+        if run_similarities is not None and candidate_embedding and has_new_item_embedding:
+            best_score = max(0.0, float(run_similarities[idx, seen_rows].max()))
             if best_score >= semantic_threshold:
                 semantic_match_run = {"score": best_score}
 
@@ -181,13 +253,14 @@ async def filter_news_by_novelty(
                 "similarity": round(float(match_score), 4) if match_score is not None else None,
             })
             if candidate_embedding:
-                known_semantic_embeddings.append(candidate_embedding)
+                seen_rows.append(idx)
             continue
 
         article["_novelty_embedding"] = candidate_embedding or []
         new_items.append(article)
         if candidate_embedding:
-            new_item_embeddings.append(candidate_embedding)
+            has_new_item_embedding = True
+            seen_rows.append(idx)
 
     stats["new_count"] = len(new_items)
 
@@ -1,4 +1,4 @@
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
@@ -16,8 +16,8 @@ def render_report(data: dict) -> Path:
 
         file_path = output_dir / f"{data['date']}.json"
 
-        with file_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Komplett im Speicher (orjson) serialisieren und in einem Write schreiben.
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         logger.info(f"📄 Debug-Report gespeichert unter: {file_path}")
         return file_path
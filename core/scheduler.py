@@ -1,13 +1,14 @@
-import time
-from datetime import datetime
-from pathlib import Path
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Optional
 
 import pytz
-import yaml
 from apscheduler.schedulers.background import BackgroundScheduler
 from loguru import logger
 
+from config.settings_loader import load_settings
 from core.briefing_agent import (
     persist_prepared_memory,
     prepare_briefing_payload,
@@ -22,12 +23,14 @@ _scheduler: Optional[BackgroundScheduler] = None
 _scheduler_meta = {}
 PREPARE_JOB_ID = "daily_prepare_briefing"
 SEND_JOB_ID = "daily_send_briefing"
+DEFAULT_PREP_LEAD_MINUTES = 5
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
 
 
 def prepare_briefing():
     """
     Führt die Analyse aus und speichert die Blöcke für späteren Versand.
-    Wird 5 Minuten vor der geplanten Zeit ausgeführt.
+    Wird prep_lead_minutes (Standard 5) vor der geplanten Zeit ausgeführt.
     """
     global _prepared_payload
 
@@ -35,8 +38,14 @@ def prepare_briefing():
 
     try:
         _prepared_payload = prepare_briefing_payload()
-        render_report(_prepared_payload["report_data"])
-        archive_briefing(_prepared_payload["archive_entry"])
+        # Report und Archiv sind unabhängige Datei-Writes und laufen parallel.
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="briefing-io") as pool:
+            side_jobs = [
+                pool.submit(render_report, _prepared_payload["report_data"]),
+                pool.submit(archive_briefing, _prepared_payload["archive_entry"]),
+            ]
+            for job in side_jobs:
+                job.result()
         logger.info("✅ Briefing vorbereitet und wartet auf Versand.")
     except Exception as e:
         logger.exception(f"❌ Fehler bei Briefing-Vorbereitung: {e}")
@@ -63,29 +72,55 @@ def send_briefing():
         run_briefing_test(send_telegram=True)
 
 
-def _load_scheduler_config():
-    with open(Path("config/settings.yaml"), "r", encoding="utf-8") as f:
-        settings = yaml.safe_load(f)
+def _weekday_index(token: str) -> int:
+    token = token.strip().lower()
+    idx = int(token) if token.isdigit() else _WEEKDAYS.index(token)
+    if not 0 <= idx < len(_WEEKDAYS):
+        raise ValueError(token)
+    return idx
+
+
+def _shift_day_of_week(expr: str, days: int) -> str:
+    """
+    Verschiebt einen Cron-Wochentag-Ausdruck (z.B. "tue-sat") um days Tage,
+    damit die Vorbereitung bei Versand kurz nach Mitternacht am Vortag läuft.
+    """
+    if days == 0 or expr.strip() == "*":
+        return expr
+
+    try:
+        selected = set()
+        for part in expr.split(","):
+            first, _, last = part.partition("-")
+            start = _weekday_index(first)
+            end = _weekday_index(last) if last else start
+            selected.update(range(start, end + 1))
+    except ValueError:
+        logger.warning(f"⚠️ Wochentage '{expr}' nicht verschiebbar – Vorbereitung nutzt sie unverändert.")
+        return expr
+
+    return ",".join(_WEEKDAYS[idx] for idx in sorted((day + days) % 7 for day in selected))
+
 
-    sched_cfg = settings.get("scheduler", {})
+def _load_scheduler_config():
+    sched_cfg = load_settings().get("scheduler", {}) or {}
     time_str = sched_cfg.get("time", "07:00")
     timezone = sched_cfg.get("timezone", "Europe/Vienna")
     day_of_week = sched_cfg.get("day_of_week", "tue-sat")
+    lead_minutes = int(sched_cfg.get("prep_lead_minutes", DEFAULT_PREP_LEAD_MINUTES))
     hour, minute = map(int, time_str.split(":"))
 
-    prep_minute = minute - 5
-    prep_hour = hour
-    if prep_minute < 0:
-        prep_minute += 60
-        prep_hour -= 1
-        if prep_hour < 0:
-            prep_hour = 23
+    # Nur Uhrzeit und Tagesversatz sind relevant, das Datum ist beliebig.
+    send_at = datetime(2000, 1, 3, hour, minute)
+    prep_at = send_at - timedelta(minutes=lead_minutes)
+    day_offset = (prep_at.date() - send_at.date()).days
 
     return {
         "hour": hour,
         "minute": minute,
-        "prep_hour": prep_hour,
-        "prep_minute": prep_minute,
+        "prep_hour": prep_at.hour,
+        "prep_minute": prep_at.minute,
+        "prep_day_of_week": _shift_day_of_week(day_of_week, day_offset),
         "time_str": time_str,
         "timezone": timezone,
         "day_of_week": day_of_week,
@@ -108,7 +143,7 @@ def start_scheduler_background() -> BackgroundScheduler:
         "cron",
         hour=cfg["prep_hour"],
         minute=cfg["prep_minute"],
-        day_of_week=cfg["day_of_week"],
+        day_of_week=cfg.get("prep_day_of_week", cfg["day_of_week"]),
         id=PREPARE_JOB_ID,
         replace_existing=True,
     )
@@ -169,10 +204,13 @@ def start_scheduler():
     Legacy blocking mode: startet den Scheduler im Hintergrund
     und blockiert den Prozess bis zum manuellen Stop.
     """
+    stop_event = threading.Event()
+    # SIGTERM (z.B. systemd) beendet sofort, statt auf einen Polling-Tick zu warten.
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
     try:
         start_scheduler_background()
-        while True:
-            time.sleep(1)
+        stop_event.wait()
+        stop_scheduler_background()
     except (KeyboardInterrupt, SystemExit):
         stop_scheduler_background()
     except Exception as e:
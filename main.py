@@ -1,6 +1,12 @@
 import argparse
+import sys
 import time
 from pathlib import Path
+
+# asyncio.Runner (uvloop) und asyncio.TaskGroup gibt es erst ab 3.11.
+if sys.version_info < (3, 11):
+    sys.exit("Python 3.11+ erforderlich.")
+
 from core.briefing_agent import run_briefing_test
 from core.scheduler import start_scheduler_background, stop_scheduler_background
 from loguru import logger
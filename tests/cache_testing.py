@@ -0,0 +1,30 @@
+import importlib
+import tempfile
+from pathlib import Path
+
+
+class TempCacheMixin:
+    """Leitet utils.cache für die Dauer eines Tests auf eine temporäre SQLite-Datei um."""
+
+    _CACHE_GLOBALS = ("CACHE_PATH", "_conn", "_load_attempted", "_semantic_index", "_pending_writes")
+
+    def setUp(self):
+        super().setUp()
+        # Import erst hier, damit Testmodule ohne numpy & Co. trotzdem laden (skipIf).
+        cache = importlib.import_module("utils.cache")
+        self._cache_tmpdir = tempfile.TemporaryDirectory()
+        self._saved_cache_globals = {name: getattr(cache, name) for name in self._CACHE_GLOBALS}
+        cache.CACHE_PATH = Path(self._cache_tmpdir.name) / "cache.sqlite3"
+        cache._conn = None
+        cache._load_attempted = False
+        cache._semantic_index = {}
+        cache._pending_writes = 0
+
+    def tearDown(self):
+        cache = importlib.import_module("utils.cache")
+        if cache._conn is not None:
+            cache._conn.close()
+        for name, value in self._saved_cache_globals.items():
+            setattr(cache, name, value)
+        self._cache_tmpdir.cleanup()
+        super().tearDown()
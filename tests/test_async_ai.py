@@ -0,0 +1,255 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from cache_testing import TempCacheMixin
+
+ASYNC_AI_IMPORT_ERROR = None
+try:
+    from core.async_ai import (
+        AdmissionController,
+        ArticleBatcher,
+        SIGNAL_CACHE_TTL_SECONDS,
+        SIGNAL_MODEL,
+        RateLimiter,
+        _SignalArrayParser,
+        _cache_key,
+        _get_cached_signal,
+        _is_trivial_article,
+        _normalize_signal,
+        _process_internal,
+        _prompt_version,
+        classify_sentiment,
+    )
+except ModuleNotFoundError as exc:
+    ASYNC_AI_IMPORT_ERROR = exc
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestAdmissionController(unittest.IsolatedAsyncioTestCase):
+    async def test_limit_caps_parallel_holders(self):
+        controller = AdmissionController(2)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            async with controller:
+                peak = max(peak, controller.active)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+        self.assertEqual(peak, 2)
+        self.assertEqual(controller.active, 0)
+
+    async def test_raising_limit_wakes_waiters(self):
+        controller = AdmissionController(1)
+        await controller.acquire()
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        await controller.set_limit(2)
+        await asyncio.wait_for(waiter, timeout=1)
+        self.assertEqual(controller.active, 2)
+
+    async def test_rate_limit_halves_and_successes_restore_limit(self):
+        controller = AdmissionController(4)
+
+        await controller.on_rate_limited()
+        self.assertEqual(controller.limit, 2)
+
+        for _ in range(2 + 3):
+            await controller.on_success()
+        self.assertEqual(controller.limit, 4)
+        for _ in range(10):
+            await controller.on_success()
+        self.assertEqual(controller.limit, 4)
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_refund_makes_unused_tokens_available_again(self):
+        limiter = RateLimiter(rpm=6000, tpm=60000)
+        reserved = await limiter.acquire(60000)
+        self.assertEqual(reserved, 60000)
+
+        limiter.refund(reserved)
+        await asyncio.wait_for(limiter.acquire(60000), timeout=0.05)
+
+    async def test_exhausted_token_bucket_blocks_until_refill(self):
+        limiter = RateLimiter(rpm=6000, tpm=60000)
+        await limiter.acquire(60000)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(30000), timeout=0.05)
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestArticleBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_articles_within_wait_window_share_one_call(self):
+        async def fake_extract(batch, on_signal=None):
+            return [{"event": article["title"]} for article, _ in batch]
+
+        batcher = ArticleBatcher(max_batch=8, max_wait_ms=10)
+        with patch("core.async_ai._extract_signals", AsyncMock(side_effect=fake_extract)) as extract:
+            futures = [batcher.submit({"title": f"A{i}"}, "Nvidia") for i in range(3)]
+            results = await asyncio.gather(*futures)
+
+        extract.assert_awaited_once()
+        self.assertEqual([r["event"] for r in results], ["A0", "A1", "A2"])
+
+    async def test_full_batch_is_flushed_without_waiting(self):
+        async def fake_extract(batch, on_signal=None):
+            return [{"event": article["title"]} for article, _ in batch]
+
+        batcher = ArticleBatcher(max_batch=2, max_wait_ms=10_000)
+        with patch("core.async_ai._extract_signals", AsyncMock(side_effect=fake_extract)) as extract:
+            futures = [batcher.submit({"title": f"A{i}"}, "Nvidia") for i in range(2)]
+            await asyncio.wait_for(asyncio.gather(*futures), timeout=1)
+
+        self.assertEqual(extract.await_count, 1)
+
+    async def test_same_key_shares_one_request(self):
+        async def fake_extract(batch, on_signal=None):
+            return [{"event": article["title"]} for article, _ in batch]
+
+        batcher = ArticleBatcher(max_batch=8, max_wait_ms=10)
+        with patch("core.async_ai._extract_signals", AsyncMock(side_effect=fake_extract)) as extract:
+            first = batcher.submit({"title": "A"}, "Nvidia", key="k1")
+            second = batcher.submit({"title": "A"}, "Nvidia", key="k1")
+            results = await asyncio.gather(first, second)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(extract.await_args.args[0]), 1)
+        self.assertEqual(results[0], results[1])
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestSignalCache(unittest.TestCase):
+    def test_fresh_entry_is_returned_and_stale_entry_ignored(self):
+        signal = {"event": "Nvidia launches chip"}
+        fresh = {"ts": time.time(), "signal": signal}
+        stale = {"ts": time.time() - SIGNAL_CACHE_TTL_SECONDS - 1, "signal": signal}
+
+        with patch("core.async_ai.get_cache", return_value=fresh):
+            self.assertEqual(_get_cached_signal("k"), signal)
+        with patch("core.async_ai.get_cache", return_value=stale):
+            self.assertIsNone(_get_cached_signal("k"))
+        # Alte Einträge ohne Zeitstempel werden neu analysiert.
+        with patch("core.async_ai.get_cache", return_value=signal):
+            self.assertIsNone(_get_cached_signal("k"))
+
+    def test_prompt_change_invalidates_cache_key(self):
+        article = {"title": "Nvidia launches chip", "content": "Body"}
+        _prompt_version.cache_clear()
+        try:
+            with patch("core.async_ai.load_prompt", return_value="v1"):
+                first = _cache_key(article, "Nvidia")
+            _prompt_version.cache_clear()
+            with patch("core.async_ai.load_prompt", return_value="v2"):
+                second = _cache_key(article, "Nvidia")
+        finally:
+            _prompt_version.cache_clear()
+        self.assertNotEqual(first, second)
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestSemanticSignalCache(TempCacheMixin, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        super().setUp()
+        _prompt_version.cache_clear()
+
+    def tearDown(self):
+        _prompt_version.cache_clear()
+        super().tearDown()
+
+    async def test_semantic_hit_is_not_copied_into_exact_cache(self):
+        article = {"title": "Nvidia Q3 beat", "content": "Body", "_novelty_embedding": [1.0, 0.0]}
+        signal = {"event": "Nvidia Q2 beat"}
+
+        with patch("core.async_ai.get_cache", return_value=None), patch(
+            "core.async_ai.get_semantic_cache", return_value=signal
+        ) as lookup, patch("core.async_ai.set_cache") as store:
+            result = await _process_internal(article, "Nvidia")
+
+        self.assertEqual(result, signal)
+        store.assert_not_called()
+        self.assertIn(SIGNAL_MODEL, lookup.call_args.args[0])
+        self.assertEqual(lookup.call_args.kwargs["max_age_seconds"], SIGNAL_CACHE_TTL_SECONDS)
+
+    async def test_prompt_change_misses_semantic_cache(self):
+        batcher = AsyncMock()
+        batcher.submit.return_value = {"event": "Nvidia Q2 beat"}
+        q2 = {"title": "Nvidia Q2 beat", "content": "Body", "_novelty_embedding": [1.0, 0.0]}
+        q2_repost = {"title": "Nvidia beats in Q2", "content": "Body", "_novelty_embedding": [1.0, 0.0]}
+
+        with patch("core.async_ai._get_batcher", return_value=batcher):
+            with patch("core.async_ai.load_prompt", return_value="v1"):
+                await _process_internal(q2, "Nvidia")
+                await _process_internal(q2_repost, "Nvidia")
+            self.assertEqual(batcher.submit.await_count, 1)  # semantischer Treffer
+
+            _prompt_version.cache_clear()
+            with patch("core.async_ai.load_prompt", return_value="v2"):
+                await _process_internal(q2_repost, "Nvidia")
+
+        self.assertEqual(batcher.submit.await_count, 2)
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestTrivialArticles(unittest.TestCase):
+    def test_quote_pages_and_bare_titles_skip_the_model(self):
+        self.assertTrue(_is_trivial_article({"title": "Nvidia Stock Price Today", "content": ""}))
+        self.assertTrue(_is_trivial_article({"title": "Nvidia news", "content": ""}))
+        self.assertFalse(_is_trivial_article({"title": "Nvidia launches new AI chip", "content": ""}))
+        self.assertFalse(
+            _is_trivial_article({"title": "Nvidia stock price", "content": "Shares rose after strong data center sales."})
+        )
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestSignalArrayParser(unittest.TestCase):
+    def test_objects_are_emitted_as_soon_as_they_close(self):
+        parser = _SignalArrayParser()
+        self.assertEqual(parser.feed('{"signals": [{"id": 1, "event": "A {x}'), [])
+        first = parser.feed('"}, {"id": 2, "event": "B \\"quoted\\""')
+        self.assertEqual(first, [{"id": 1, "event": "A {x}"}])
+        second = parser.feed("}]}")
+        self.assertEqual(second, [{"id": 2, "event": 'B "quoted"'}])
+
+
+@unittest.skipIf(ASYNC_AI_IMPORT_ERROR is not None, f"optional dependency missing: {ASYNC_AI_IMPORT_ERROR}")
+class TestSentimentFallback(unittest.TestCase):
+    def test_lexicon_classifies_headlines(self):
+        self.assertEqual(classify_sentiment("Nvidia beats estimates, shares surge"), "positiv")
+        self.assertEqual(classify_sentiment("Visa faces antitrust lawsuit, stock falls"), "negativ")
+        self.assertEqual(classify_sentiment("Microsoft schedules annual meeting"), "neutral")
+
+    def test_markers_do_not_match_word_prefixes(self):
+        self.assertEqual(classify_sentiment("SpaceX mission uses fallback missile design"), "neutral")
+        self.assertEqual(classify_sentiment("Recorded call from stronghold"), "neutral")
+        self.assertEqual(classify_sentiment("Zölle belasten den Kurs"), "negativ")
+
+    def test_german_compounds_match(self):
+        self.assertEqual(classify_sentiment("Aktie bricht ein nach Gewinnwarnung"), "negativ")
+        self.assertEqual(classify_sentiment("Siemens Energy: Umsatzplus und Rekordauftrag"), "positiv")
+        self.assertEqual(classify_sentiment("Quartalsverlust weitet sich aus"), "negativ")
+
+    def test_negated_markers_are_ignored(self):
+        self.assertEqual(classify_sentiment("Nvidia is not expected to miss estimates"), "neutral")
+        self.assertEqual(classify_sentiment("Kein Einbruch bei der Nachfrage"), "neutral")
+
+    def test_missing_model_sentiment_uses_local_classifier(self):
+        signal = _normalize_signal({"event": "Q3"}, {"title": "TSMC posts record profit"})
+        self.assertEqual(signal["sentiment"], "positiv")
+        self.assertEqual(signal["emoji"], "🟢")
+
+    def test_valid_model_sentiment_is_kept(self):
+        signal = _normalize_signal({"sentiment": "negative"}, {"title": "TSMC posts record profit"})
+        self.assertEqual(signal["sentiment"], "negativ")
+
+
+if __name__ == "__main__":
+    unittest.main()
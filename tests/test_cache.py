@@ -0,0 +1,106 @@
+import sqlite3
+import time
+import unittest
+
+from cache_testing import TempCacheMixin
+
+CACHE_IMPORT_ERROR = None
+try:
+    import numpy as np
+
+    import utils.cache as cache
+    from utils.cache import get_semantic_cache, set_semantic_cache
+except ModuleNotFoundError as exc:
+    CACHE_IMPORT_ERROR = exc
+
+
+@unittest.skipIf(CACHE_IMPORT_ERROR is not None, f"optional dependency missing: {CACHE_IMPORT_ERROR}")
+class TestSemanticCache(TempCacheMixin, unittest.TestCase):
+    namespace = "test"
+
+    def test_similar_embedding_returns_cached_value(self):
+        set_semantic_cache(self.namespace, [1.0, 0.0, 0.0], {"event": "Quartalszahlen"})
+
+        hit = get_semantic_cache(self.namespace, [0.95, 0.1, 0.0], 0.87)
+        self.assertEqual(hit, {"event": "Quartalszahlen"})
+
+    def test_dissimilar_embedding_misses(self):
+        set_semantic_cache(self.namespace, [1.0, 0.0, 0.0], {"event": "Quartalszahlen"})
+
+        self.assertIsNone(get_semantic_cache(self.namespace, [0.0, 1.0, 0.0], 0.87))
+        self.assertIsNone(get_semantic_cache(f"{self.namespace}-other", [1.0, 0.0, 0.0], 0.87))
+
+    def test_best_match_wins(self):
+        set_semantic_cache(self.namespace, [1.0, 0.0], {"event": "A"})
+        set_semantic_cache(self.namespace, [0.0, 1.0], {"event": "B"})
+
+        self.assertEqual(get_semantic_cache(self.namespace, [0.1, 0.99], 0.87), {"event": "B"})
+
+    def test_index_keeps_latest_dimension_after_model_change(self):
+        set_semantic_cache(self.namespace, [1.0, 0.0, 0.0], {"event": "alt"})
+        set_semantic_cache(self.namespace, [0.0, 1.0], {"event": "neu"})
+        cache._semantic_index.pop(self.namespace, None)  # Neuaufbau aus SQLite erzwingen
+
+        self.assertEqual(get_semantic_cache(self.namespace, [0.0, 1.0], 0.87), {"event": "neu"})
+
+    def test_entries_older_than_max_age_are_ignored(self):
+        set_semantic_cache(self.namespace, [1.0, 0.0], {"event": "Q2 beat"})
+        cache._conn.execute("UPDATE semantic_cache SET created_at = created_at - 100")
+        cache._semantic_index.pop(self.namespace, None)
+
+        self.assertIsNone(get_semantic_cache(self.namespace, [1.0, 0.0], 0.87, max_age_seconds=50))
+        self.assertEqual(get_semantic_cache(self.namespace, [1.0, 0.0], 0.87, max_age_seconds=500), {"event": "Q2 beat"})
+
+    def test_legacy_rows_without_timestamp_count_as_expired(self):
+        # Datenbank im alten Schema anlegen, bevor utils.cache sie öffnet.
+        conn = sqlite3.connect(str(cache.CACHE_PATH))
+        conn.execute(
+            "CREATE TABLE semantic_cache (id INTEGER PRIMARY KEY AUTOINCREMENT, namespace TEXT NOT NULL, "
+            "embedding BLOB NOT NULL, value TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO semantic_cache (namespace, embedding, value) VALUES (?, ?, ?)",
+            (self.namespace, np.array([1.0, 0.0], dtype=np.float32).tobytes(), '{"event": "alt"}'),
+        )
+        conn.commit()
+        conn.close()
+
+        self.assertIsNone(get_semantic_cache(self.namespace, [1.0, 0.0], 0.87, max_age_seconds=86400))
+        # created_at = 0 liegt vor jeder Aufbewahrungsfrist – die Zeile wird beim Start gelöscht.
+        self.assertIsNone(get_semantic_cache(self.namespace, [1.0, 0.0], 0.87))
+
+
+class TestCachePruning(TempCacheMixin, unittest.TestCase):
+    def _reopen(self):
+        cache.save_cache()
+        cache._conn.close()
+        cache._conn = None
+        cache._load_attempted = False
+
+    def test_expired_signals_are_deleted_on_startup(self):
+        expired = time.time() - cache.SIGNAL_CACHE_MAX_AGE_DAYS * 86400 - 1
+        cache.set_cache("signal::alt", {"ts": expired, "signal": {"event": "alt"}})
+        cache.set_cache("signal::ohne-ts", {"event": "altformat"})
+        cache.set_cache("signal::neu", {"ts": time.time(), "signal": {"event": "neu"}})
+        cache.set_cache("andere::key", {"ts": expired})
+        self._reopen()
+
+        self.assertIsNone(cache.get_cache("signal::alt"))
+        self.assertIsNone(cache.get_cache("signal::ohne-ts"))
+        self.assertIsNotNone(cache.get_cache("signal::neu"))
+        self.assertIsNotNone(cache.get_cache("andere::key"))
+
+    def test_feeds_not_fetched_for_a_week_are_deleted_on_startup(self):
+        stale = time.time() - cache.FEED_CACHE_MAX_AGE_DAYS * 86400 - 1
+        cache.set_cache("feed::https://alt.example/rss", {"ts": stale, "etag": "a", "articles": []})
+        cache.set_cache("feed::https://ohne-ts.example/rss", {"etag": "b", "articles": []})
+        cache.set_cache("feed::https://aktiv.example/rss", {"ts": time.time(), "etag": "c", "articles": []})
+        self._reopen()
+
+        self.assertIsNone(cache.get_cache("feed::https://alt.example/rss"))
+        self.assertIsNone(cache.get_cache("feed::https://ohne-ts.example/rss"))
+        self.assertIsNotNone(cache.get_cache("feed::https://aktiv.example/rss"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+FETCH_NEWS_IMPORT_ERROR = None
+try:
+    import feedparser
+    import httpx
+
+    from core.fetch_news import LXML_AVAILABLE, HostRateLimiter, fetch_source, parse_feed, parse_rss_fast
+except ModuleNotFoundError as exc:
+    FETCH_NEWS_IMPORT_ERROR = exc
+    LXML_AVAILABLE = False
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<title>Example News</title><link>https://example.com/</link>
+<item><title>Nvidia launches chip (NASDAQ:NVDA)</title><link>https://example.com/a</link>
+<description>Nvidia &amp; partners ship a new GPU.</description><pubDate>Mon, 02 Mar 2026 08:00:00 GMT</pubDate></item>
+<item><title>Visa beats estimates</title><link>https://example.com/b</link>
+<pubDate>Mon, 02 Mar 2026 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>
+<entry><title>Entry</title><link href="https://example.com/c"/></entry></feed>"""
+
+
+@unittest.skipIf(FETCH_NEWS_IMPORT_ERROR is not None or not LXML_AVAILABLE, "optional dependency missing: lxml")
+class TestParseRssFast(unittest.TestCase):
+    def test_matches_feedparser_for_rss(self):
+        self.assertEqual(parse_rss_fast(RSS), parse_feed(feedparser.parse(RSS)))
+
+    def test_atom_and_broken_xml_fall_back(self):
+        self.assertIsNone(parse_rss_fast(ATOM))
+        self.assertIsNone(parse_rss_fast(b"<rss><channel>"))
+
+
+@unittest.skipIf(FETCH_NEWS_IMPORT_ERROR is not None, f"optional dependency missing: {FETCH_NEWS_IMPORT_ERROR}")
+class TestConditionalGet(unittest.IsolatedAsyncioTestCase):
+    async def test_not_modified_feed_reuses_cached_articles(self):
+        store = {}
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=RSS, headers={"etag": '"v1"', "content-type": "application/rss+xml"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch("core.fetch_news.get_http_client", return_value=client), patch(
+                "core.fetch_news.get_cache", side_effect=store.get
+            ), patch("core.fetch_news.set_cache", side_effect=store.__setitem__):
+                first = await fetch_source("https://example.com/rss")
+                second = await fetch_source("https://example.com/rss")
+
+        self.assertEqual(seen_headers, [None, '"v1"'])
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, first)
+        self.assertIn("ts", store["feed::https://example.com/rss"])
+
+
+@unittest.skipIf(FETCH_NEWS_IMPORT_ERROR is not None, f"optional dependency missing: {FETCH_NEWS_IMPORT_ERROR}")
+class TestHostRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_is_capped_at_rate(self):
+        limiter = HostRateLimiter(2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
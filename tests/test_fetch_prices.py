@@ -5,7 +5,7 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 sys.modules.setdefault("loguru", SimpleNamespace(logger=SimpleNamespace(error=lambda *a, **k: None, warning=lambda *a, **k: None)))
-sys.modules.setdefault("yfinance", SimpleNamespace(Ticker=None))
+sys.modules.setdefault("yfinance", SimpleNamespace(Ticker=None, download=None))
 FETCH_PRICES_IMPORT_ERROR = None
 try:
     from core.fetch_prices import get_price_changes
@@ -76,8 +76,9 @@ class _TickerMock:
 
 @unittest.skipIf(FETCH_PRICES_IMPORT_ERROR is not None, f"optional dependency missing: {FETCH_PRICES_IMPORT_ERROR}")
 class TestFetchPrices(unittest.TestCase):
+    @patch("core.fetch_prices.yf.download", return_value=None)
     @patch("core.fetch_prices.yf.Ticker")
-    def test_since_watchlist_is_calculated_from_added_at_when_close_missing(self, ticker_cls):
+    def test_since_watchlist_is_calculated_from_added_at_when_close_missing(self, ticker_cls, _download):
         recent = _FakeData(
             [datetime(2026, 3, 20), datetime(2026, 3, 21)],
             [110.0, 121.0],
@@ -1,4 +1,7 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
 
 NEWS_MEMORY_IMPORT_ERROR = None
 try:
@@ -6,7 +9,10 @@ try:
         build_title_fingerprint,
         canonicalize_url,
         cosine_similarity,
+        find_semantic_matches,
+        load_memory,
         normalize_text,
+        save_memory,
     )
 except ModuleNotFoundError as exc:
     NEWS_MEMORY_IMPORT_ERROR = exc
@@ -28,9 +34,117 @@ class TestNewsMemory(unittest.TestCase):
         self.assertAlmostEqual(cosine_similarity([1.0, 0.0], [1.0, 0.0]), 1.0, places=6)
         self.assertAlmostEqual(cosine_similarity([1.0, 0.0], [0.0, 1.0]), 0.0, places=6)
 
+    def test_find_semantic_matches_picks_best_entry_per_candidate(self):
+        entries = [
+            {"title": "A", "topic_embedding": [1.0, 0.0]},
+            {"title": "B", "topic_embedding": [0.0, 1.0]},
+            {"title": "alt", "topic_embedding": [1.0, 0.0, 0.0]},
+        ]
+        matches = find_semantic_matches(entries, [[0.0, 2.0], [1.0, 1.0], []], 0.86)
+
+        self.assertEqual(matches[0]["entry"]["title"], "B")
+        self.assertAlmostEqual(matches[0]["score"], 1.0, places=5)
+        self.assertIsNone(matches[1])
+        self.assertIsNone(matches[2])
+
+    def test_matrix_cache_is_reused_and_not_persisted(self):
+        entries = [{"title": "A", "topic_embedding": [1.0, 0.0]}]
+        memory = {"version": 1, "entries": entries, "_embedding_cache": {}}
+        cache = memory["_embedding_cache"]
+
+        find_semantic_matches(entries, [[1.0, 0.0]], 0.86, matrix_cache=cache)
+        cached_matrix = next(iter(cache.values()))[1]
+        matches = find_semantic_matches(entries, [[2.0, 0.0]], 0.86, matrix_cache=cache)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIs(next(iter(cache.values()))[1], cached_matrix)
+        self.assertEqual(matches[0]["entry"]["title"], "A")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "news_memory.json"
+            save_memory(memory, path)
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        self.assertNotIn("_embedding_cache", raw)
+
     def test_normalize_text_collapses_whitespace(self):
         self.assertEqual(normalize_text("  hello,\n  WORLD! "), "hello world")
 
+    def test_save_and_load_roundtrip_keeps_quantized_embeddings_outside_json(self):
+        memory = {
+            "version": 1,
+            "entries": [
+                {"stock_name": "Nvidia", "title": "Chip", "topic_embedding": [0.5, -0.25, 1.0]},
+                {"stock_name": "Nvidia", "title": "Ohne Embedding", "topic_embedding": []},
+            ],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "news_memory.json"
+            save_memory(memory, path)
+
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            self.assertNotIn("topic_embedding", raw["entries"][0])
+            self.assertTrue(path.with_suffix(".npz").exists())
+
+            loaded = load_memory(path)
+
+        # int8-Quantisierung: Werte bis auf eine Quantisierungsstufe erhalten.
+        for got, expected in zip(loaded["entries"][0]["topic_embedding"], [0.5, -0.25, 1.0]):
+            self.assertAlmostEqual(got, expected, delta=1 / 127)
+        self.assertEqual(loaded["entries"][1]["topic_embedding"], [])
+        self.assertNotIn("embedding_row", loaded["entries"][0])
+
+    def test_mixed_dimensions_are_truncated_and_stay_in_sidecar(self):
+        memory = {
+            "version": 1,
+            "entries": [
+                {"stock_name": "Nvidia", "title": "Alt", "topic_embedding": [3.0, 4.0, 5.0, 6.0]},
+                {"stock_name": "Nvidia", "title": "Neu", "topic_embedding": [0.0, 1.0]},
+            ],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "news_memory.json"
+            save_memory(memory, path)
+
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            self.assertTrue(all("topic_embedding" not in e for e in raw["entries"]))
+            loaded = load_memory(path)
+
+        for got, expected in zip(loaded["entries"][0]["topic_embedding"], [0.6, 0.8]):
+            self.assertAlmostEqual(got, expected, delta=1 / 127)
+        self.assertEqual(len(loaded["entries"][1]["topic_embedding"]), 2)
+
+    def test_stale_json_after_crash_drops_embeddings(self):
+        def memory_with(*titles):
+            vectors = {"old": [1.0, 0.0], "keep": [0.0, 1.0], "new": [-1.0, 0.0]}
+            return {
+                "version": 1,
+                "entries": [{"stock_name": "A", "title": t, "topic_embedding": vectors[t]} for t in titles],
+            }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "news_memory.json"
+            save_memory(memory_with("old", "keep"), path)
+            json_a = path.read_bytes()
+            save_memory(memory_with("keep", "new"), path)
+            # Absturz zwischen .npz- und JSON-Replace simulieren.
+            path.write_bytes(json_a)
+
+            loaded = load_memory(path)
+
+        self.assertEqual([e["topic_embedding"] for e in loaded["entries"]], [[], []])
+        self.assertNotIn("embedding_generation", loaded)
+
+    def test_legacy_inline_embeddings_still_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "news_memory.json"
+            path.write_text(
+                json.dumps({"version": 1, "entries": [{"stock_name": "A", "topic_embedding": [1.0, 0.0]}]}),
+                encoding="utf-8",
+            )
+            loaded = load_memory(path)
+
+        self.assertEqual(loaded["entries"][0]["topic_embedding"], [1.0, 0.0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,16 +1,18 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+
+from cache_testing import TempCacheMixin
 
 NEWS_NOVELTY_IMPORT_ERROR = None
 try:
-    from core.news_novelty import filter_news_by_novelty
+    from core.news_novelty import _embed_texts, filter_news_by_novelty, prefetch_embeddings
     from utils.news_memory import build_memory_entry
 except ModuleNotFoundError as exc:
     NEWS_NOVELTY_IMPORT_ERROR = exc
 
 
 @unittest.skipIf(NEWS_NOVELTY_IMPORT_ERROR is not None, f"optional dependency missing: {NEWS_NOVELTY_IMPORT_ERROR}")
-class TestNewsNovelty(unittest.IsolatedAsyncioTestCase):
+class TestNewsNovelty(TempCacheMixin, unittest.IsolatedAsyncioTestCase):
     async def test_day2_duplicate_quarterly_news_is_filtered(self):
         memory = {"version": 1, "entries": []}
         day1_article = {
@@ -69,6 +71,30 @@ class TestNewsNovelty(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(result["new_items"]), 2)
         self.assertEqual(result["stats"]["new_count"], 2)
 
+    async def test_prefetched_embeddings_are_reused_by_filter(self):
+        memory = {"version": 1, "entries": []}
+        raw_articles = [
+            {"title": "Nvidia launches new chip", "content": "new architecture", "link": "https://a.com/1"},
+            {"title": "Nvidia launches new chip", "content": "new architecture", "link": "https://b.com/1"},
+            {"title": "Nvidia expands foundry partnership", "content": "capacity expansion", "link": "https://a.com/2"},
+        ]
+        cfg = {
+            "lookback_days": 14,
+            "semantic_threshold": 0.86,
+            "exact_url_dedupe": False,
+            "exact_title_dedupe": False,
+        }
+
+        with patch("core.news_novelty._embed_texts", return_value=[[1.0, 0.0], [0.0, 1.0]]) as embed:
+            await prefetch_embeddings(raw_articles)
+            result = await filter_news_by_novelty("Nvidia", raw_articles, memory, cfg)
+
+        # Gleiche Texte werden nur einmal eingebettet, der Filter ruft die API nicht erneut auf.
+        embed.assert_called_once()
+        self.assertEqual(len(embed.call_args.args[0]), 2)
+        self.assertEqual(result["stats"]["semantic_dupes"], 1)
+        self.assertEqual(result["stats"]["new_count"], 2)
+
     async def test_exact_duplicate_link_is_filtered_without_embedding(self):
         memory = {"version": 1, "entries": []}
         article = {
@@ -100,6 +126,17 @@ class TestNewsNovelty(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["stats"]["exact_dupes"], 1)
         self.assertEqual(result["stats"]["new_count"], 0)
 
+    async def test_embeddings_are_served_from_persistent_cache(self):
+        texts = ["nvidia launches chip", "visa faces lawsuit"]
+
+        with patch("core.news_novelty._embed_uncached", AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])) as api:
+            first = await _embed_texts(texts)
+            second = await _embed_texts(list(reversed(texts)))
+
+        api.assert_awaited_once()
+        self.assertEqual(first, [[1.0, 0.0], [0.0, 1.0]])
+        self.assertEqual(second, [[0.0, 1.0], [1.0, 0.0]])
+
 
 if __name__ == "__main__":
     unittest.main()
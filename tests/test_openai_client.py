@@ -0,0 +1,64 @@
+import unittest
+
+OPENAI_CLIENT_IMPORT_ERROR = None
+try:
+    import httpx
+    import openai
+
+    from utils.openai_client import call_with_retries
+except ModuleNotFoundError as exc:
+    OPENAI_CLIENT_IMPORT_ERROR = exc
+
+
+def _api_error(cls, status: int, headers=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return cls("boom", response=response, body=None)
+
+
+@unittest.skipIf(OPENAI_CLIENT_IMPORT_ERROR is not None, f"optional dependency missing: {OPENAI_CLIENT_IMPORT_ERROR}")
+class TestCallWithRetries(unittest.IsolatedAsyncioTestCase):
+    async def test_rate_limit_is_retried_after_retry_after_header(self):
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise _api_error(openai.RateLimitError, 429, {"retry-after": "0"})
+            return "ok"
+
+        result = await call_with_retries(flaky, attempts=3)
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(calls), 2)
+
+    async def test_rate_limit_triggers_callback(self):
+        calls = []
+        limited = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise _api_error(openai.RateLimitError, 429, {"retry-after": "0"})
+            return "ok"
+
+        async def on_rate_limit():
+            limited.append(1)
+
+        result = await call_with_retries(flaky, attempts=3, on_rate_limit=on_rate_limit)
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(limited), 1)
+
+    async def test_bad_request_is_not_retried(self):
+        calls = []
+
+        async def invalid():
+            calls.append(1)
+            raise _api_error(openai.BadRequestError, 400)
+
+        with self.assertRaises(openai.BadRequestError):
+            await call_with_retries(invalid, attempts=3)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
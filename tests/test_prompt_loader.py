@@ -0,0 +1,31 @@
+import unittest
+
+from utils.prompt_loader import render_prompt
+
+
+class TestPromptLoader(unittest.TestCase):
+    def test_render_prompt_fills_placeholders_in_one_pass(self):
+        prompt = render_prompt(
+            "article_signal",
+            {
+                "stock_name": "Nvidia",
+                "source_name": "Example",
+                "published_at": "2026-03-01",
+                "article_title": "Nvidia launches chip",
+                "article_text": "Body mentions {stock_name} literally.",
+            },
+        )
+        self.assertIn('Aktie "Nvidia"', prompt)
+        # Werte werden nicht erneut ersetzt.
+        self.assertIn("Body mentions {stock_name} literally.", prompt)
+        # JSON-Beispiel im Prompt bleibt unangetastet.
+        self.assertIn('"event": "string"', prompt)
+
+    def test_unknown_placeholders_are_kept(self):
+        prompt = render_prompt("market_overview", {"kursdaten": "Nvidia: +1.00%"})
+        self.assertIn("Kursdaten: Nvidia: +1.00%", prompt)
+        self.assertIn("{summaries}", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
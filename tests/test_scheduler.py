@@ -1,5 +1,7 @@
 import unittest
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
+
+import yaml
 
 SCHEDULER_IMPORT_ERROR = None
 try:
@@ -48,7 +50,7 @@ scheduler:
   time: "07:00"
   timezone: "Europe/Vienna"
 """
-        with patch("builtins.open", mock_open(read_data=yaml_content)):
+        with patch("core.scheduler.load_settings", return_value=yaml.safe_load(yaml_content)):
             cfg = scheduler._load_scheduler_config()
 
         self.assertEqual(cfg["day_of_week"], "tue-sat")
@@ -60,11 +62,25 @@ scheduler:
   timezone: "Europe/Vienna"
   day_of_week: "wed-fri"
 """
-        with patch("builtins.open", mock_open(read_data=yaml_content)):
+        with patch("core.scheduler.load_settings", return_value=yaml.safe_load(yaml_content)):
             cfg = scheduler._load_scheduler_config()
 
         self.assertEqual(cfg["day_of_week"], "wed-fri")
 
+    def test_prep_before_midnight_runs_on_previous_weekdays(self):
+        yaml_content = """
+scheduler:
+  time: "00:02"
+  day_of_week: "tue-sat"
+  prep_lead_minutes: 5
+"""
+        with patch("core.scheduler.load_settings", return_value=yaml.safe_load(yaml_content)):
+            cfg = scheduler._load_scheduler_config()
+
+        self.assertEqual((cfg["prep_hour"], cfg["prep_minute"]), (23, 57))
+        self.assertEqual(cfg["prep_day_of_week"], "mon,tue,wed,thu,fri")
+        self.assertEqual(cfg["day_of_week"], "tue-sat")
+
     def test_start_scheduler_background_passes_day_filter_to_jobs(self):
         dummy = _DummyScheduler()
         cfg = {
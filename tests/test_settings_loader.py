@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+import config.settings_loader as loader
+
+
+class TestSettingsLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.settings_path = Path(self.tmpdir.name) / "settings.yaml"
+        self.settings_path.write_text(yaml.safe_dump({"language": "de"}), encoding="utf-8")
+        self.patch_settings = patch.object(loader, "SETTINGS_PATH", self.settings_path)
+        self.patch_settings.start()
+        loader._CACHE.clear()
+
+    def tearDown(self):
+        self.patch_settings.stop()
+        loader._CACHE.clear()
+        self.tmpdir.cleanup()
+
+    def test_repeated_calls_return_cached_dict(self):
+        first = loader.load_settings()
+        with patch.object(loader.yaml, "load", side_effect=AssertionError("should not parse")):
+            second = loader.load_settings()
+        self.assertIs(first, second)
+
+    def test_file_change_invalidates_cache(self):
+        self.assertEqual(loader.load_settings()["language"], "de")
+
+        self.settings_path.write_text(yaml.safe_dump({"language": "en"}), encoding="utf-8")
+        st = self.settings_path.stat()
+        os.utime(self.settings_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(loader.load_settings()["language"], "en")
+
+
+if __name__ == "__main__":
+    unittest.main()
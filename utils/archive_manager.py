@@ -1,10 +1,11 @@
-import json
 import shutil
 import zipfile
 from datetime import datetime, timedelta
 from pathlib import Path
+import orjson
 from loguru import logger
-import yaml
+
+from config.settings_loader import load_settings
 
 ARCHIVE_DIR = Path("archive")
 OLD_OUTPUT_DIR = Path("outputs/briefings")   # alte Markdown-Reports (falls vorhanden)
@@ -16,8 +17,7 @@ LOG_DIR = Path("logs")
 # -------------------------------------------
 def load_config():
     try:
-        with open("config/settings.yaml", "r", encoding="utf-8") as f:
-            return yaml.safe_load(f).get("archive", {})
+        return load_settings().get("archive", {})
     except Exception as e:
         logger.error(f"Fehler beim Laden der Archivkonfiguration: {e}")
         return {}
@@ -52,8 +52,9 @@ def archive_briefing(entry: dict):
     jsonl_path = target_dir / f"{date}.jsonl"
 
     try:
-        with jsonl_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        with jsonl_path.open("ab") as f:
+            f.write(line)
 
         logger.info(f"📦 JSONL archiviert: {jsonl_path}")
     except Exception as e:
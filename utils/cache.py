@@ -1,60 +1,346 @@
-import json
+import atexit
+import sqlite3
+import threading
+import time
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
 from loguru import logger
 
-CACHE_PATH = Path("cache/cache.json")
+CACHE_PATH = Path("cache/cache.sqlite3")
+LEGACY_CACHE_PATH = Path("cache/cache.json")
+
+# SQLite-Verbindung (WAL) – Schreibzugriffe sind einzelne kleine Upserts
+# statt eines kompletten JSON-Rewrites pro Eintrag.
+_conn = None
+_load_attempted = False
+_lock = threading.Lock()
+
+# Commit nicht pro Eintrag, sondern gebündelt (spätestens alle N Writes,
+# am Ende der Pipeline via save_cache() und beim Prozessende).
+COMMIT_EVERY_WRITES = 50
+_pending_writes = 0
+
+# Semantischer Cache: pro Namespace (z.B. Aktie) normierte Embeddings als
+# Matrix im Speicher, damit ein Lookup ein einziges Matmul ist. created_at
+# läuft als Spalte mit, damit Lookups ein Höchstalter erzwingen können.
+SEMANTIC_CACHE_MAX_ENTRIES = 500
+_semantic_index: Dict[str, Tuple[np.ndarray, List[str], np.ndarray]] = {}
+
+# Embedding-Cache (float32-Blobs) – Einträge älter als N Tage werden beim Start verworfen.
+EMBEDDING_CACHE_MAX_AGE_DAYS = 30
+
+# Artikel-Signale ("signal::"-Keys mit {ts, signal} und semantic_cache) verfallen
+# nach N Tagen und werden beim Start gelöscht statt nur beim Lesen übersprungen.
+SIGNAL_CACHE_MAX_AGE_DAYS = 14
+
+# ETag-Einträge der Feeds ("feed::"-Keys mit ts): Feeds entfernter Aktien fallen
+# nach N Tagen ohne Abruf heraus.
+FEED_CACHE_MAX_AGE_DAYS = 7
+
+
+# ---------------------------------------------------------
+# Alten JSON-Cache einmalig übernehmen
+# ---------------------------------------------------------
+def _import_legacy_cache(conn: sqlite3.Connection):
+    if not LEGACY_CACHE_PATH.exists():
+        return
+
+    try:
+        legacy = orjson.loads(LEGACY_CACHE_PATH.read_bytes())
+        rows = [(str(k), orjson.dumps(v).decode("utf-8")) for k, v in legacy.items()]
+        conn.executemany("INSERT OR IGNORE INTO cache (key, value) VALUES (?, ?)", rows)
+        conn.commit()
+        LEGACY_CACHE_PATH.rename(LEGACY_CACHE_PATH.with_suffix(".json.migrated"))
+        logger.info(f"Alter JSON-Cache übernommen: {len(rows)} Einträge.")
+    except Exception as e:
+        logger.error(f"Fehler beim Übernehmen des JSON-Caches: {e}")
+
+
+# ---------------------------------------------------------
+# Abgelaufene Einträge beim Start löschen
+# ---------------------------------------------------------
+def _prune_expired(conn: sqlite3.Connection):
+    now = time.time()
+    conn.execute(
+        "DELETE FROM embedding_cache WHERE created_at < ?",
+        (now - EMBEDDING_CACHE_MAX_AGE_DAYS * 86400,),
+    )
+    # Einträge ohne ts (Altformat) gelten als abgelaufen.
+    for prefix, max_age_days in (("signal::", SIGNAL_CACHE_MAX_AGE_DAYS), ("feed::", FEED_CACHE_MAX_AGE_DAYS)):
+        conn.execute(
+            "DELETE FROM cache WHERE key LIKE ? AND "
+            "CASE WHEN json_valid(value) THEN COALESCE(json_extract(value, '$.ts'), 0) ELSE 0 END < ?",
+            (f"{prefix}%", now - max_age_days * 86400),
+        )
+    conn.execute(
+        "DELETE FROM semantic_cache WHERE created_at < ?",
+        (now - SIGNAL_CACHE_MAX_AGE_DAYS * 86400,),
+    )
 
-# internes Dictionary (In-Memory Cache)
-_cache = {}
 
 # ---------------------------------------------------------
 # Lade Cache beim Start
 # ---------------------------------------------------------
 def load_cache():
-    global _cache
+    global _conn, _load_attempted
 
-    if not CACHE_PATH.exists():
-        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        CACHE_PATH.write_text("{}", encoding="utf-8")
-        _cache = {}
-        return _cache
+    with _lock:
+        if _conn is not None or _load_attempted:
+            return _conn
+        _load_attempted = True
 
-    try:
-        _cache = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
-    except Exception as e:
-        logger.error(f"Fehler beim Laden des Caches: {e}")
-        _cache = {}
+        try:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(CACHE_PATH), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_cache ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, namespace TEXT NOT NULL, "
+                "embedding BLOB NOT NULL, value TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+            )
+            # Ältere Datenbanken ohne created_at: Bestandszeilen gelten als beliebig alt.
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(semantic_cache)")}
+            if "created_at" not in columns:
+                conn.execute("ALTER TABLE semantic_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+            conn.execute("CREATE INDEX IF NOT EXISTS semantic_cache_ns ON semantic_cache (namespace, id)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            _prune_expired(conn)
+            conn.commit()
+            _import_legacy_cache(conn)
+            _conn = conn
+        except Exception as e:
+            logger.error(f"Fehler beim Laden des Caches: {e}")
+            _conn = None
 
-    return _cache
+    return _conn
 
 
-# Direkt beim Import initialisieren
-load_cache()
+def _connection():
+    """Öffnet die Datenbank beim ersten Zugriff statt schon beim Import."""
+    return _conn if _conn is not None else load_cache()
 
 
 # ---------------------------------------------------------
 # Hole Wert aus Cache
 # ---------------------------------------------------------
 def get_cache(key: str):
-    return _cache.get(key)
+    if _connection() is None:
+        return None
+
+    try:
+        with _lock:
+            row = _conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return orjson.loads(row[0]) if row else None
+    except Exception as e:
+        logger.error(f"Fehler beim Lesen aus dem Cache: {e}")
+        return None
 
 
 # ---------------------------------------------------------
-# Setze Wert im Cache + speichere automatisch
+# Setze Wert im Cache (Commit gebündelt, siehe save_cache)
 # ---------------------------------------------------------
 def set_cache(key: str, value):
-    _cache[key] = value
-    save_cache()
+    global _pending_writes
+    if _connection() is None:
+        return
+
+    try:
+        with _lock:
+            _conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                (key, orjson.dumps(value).decode("utf-8")),
+            )
+            _pending_writes += 1
+            if _pending_writes >= COMMIT_EVERY_WRITES:
+                _conn.commit()
+                _pending_writes = 0
+    except Exception as e:
+        logger.error(f"Fehler beim Speichern des Caches: {e}")
+
+
+# ---------------------------------------------------------
+# Semantischer Cache (Nachbar-Suche über Embeddings)
+# ---------------------------------------------------------
+def _normalize_vector(embedding: Sequence[float]) -> Optional[np.ndarray]:
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if vec.ndim != 1 or norm == 0.0:
+        return None
+    return vec / norm
+
+
+def _load_semantic_index(namespace: str) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """Lädt die letzten Einträge eines Namespace einmalig aus SQLite (Aufrufer hält _lock)."""
+    index = _semantic_index.get(namespace)
+    if index is not None:
+        return index
+
+    # Ältere Einträge über dem Limit verwerfen, bevor die Matrix gebaut wird.
+    _conn.execute(
+        "DELETE FROM semantic_cache WHERE namespace = ? AND id NOT IN "
+        "(SELECT id FROM semantic_cache WHERE namespace = ? ORDER BY id DESC LIMIT ?)",
+        (namespace, namespace, SEMANTIC_CACHE_MAX_ENTRIES),
+    )
+    rows = _conn.execute(
+        "SELECT embedding, value, created_at FROM semantic_cache WHERE namespace = ? ORDER BY id",
+        (namespace,),
+    ).fetchall()
+
+    # Nach einem Wechsel der Embedding-Dimension zählen nur Einträge mit der
+    # Dimension des jüngsten Eintrags.
+    vectors = [np.frombuffer(row[0], dtype=np.float32) for row in rows]
+    dim = vectors[-1].shape[0] if vectors else 0
+    keep = [idx for idx, v in enumerate(vectors) if v.shape[0] == dim]
+    if keep:
+        matrix = np.vstack([vectors[idx] for idx in keep])
+        values = [rows[idx][1] for idx in keep]
+        created = np.array([rows[idx][2] for idx in keep], dtype=np.float64)
+    else:
+        matrix = np.empty((0, 0), dtype=np.float32)
+        values = []
+        created = np.empty(0, dtype=np.float64)
+
+    index = (matrix, values, created)
+    _semantic_index[namespace] = index
+    return index
+
+
+def get_semantic_cache(
+    namespace: str,
+    embedding: Sequence[float],
+    threshold: float,
+    max_age_seconds: Optional[float] = None,
+):
+    """
+    Liefert den Wert des ähnlichsten Eintrags, wenn die Cosine-Similarity >= threshold ist.
+    Mit max_age_seconds zählen nur Einträge, die jünger sind.
+    """
+    if not embedding or _connection() is None:
+        return None
+
+    query = _normalize_vector(embedding)
+    if query is None:
+        return None
+
+    try:
+        with _lock:
+            matrix, values, created = _load_semantic_index(namespace)
+        if not values or matrix.shape[1] != query.shape[0]:
+            return None
+
+        scores = matrix @ query
+        if max_age_seconds is not None:
+            scores = np.where(created >= time.time() - max_age_seconds, scores, -np.inf)
+        best = int(np.argmax(scores))
+        if float(scores[best]) < threshold:
+            return None
+        return orjson.loads(values[best])
+    except Exception as e:
+        logger.error(f"Fehler beim Lesen aus dem semantischen Cache: {e}")
+        return None
+
+
+def set_semantic_cache(namespace: str, embedding: Sequence[float], value):
+    global _pending_writes
+    if not embedding or _connection() is None:
+        return
+
+    vector = _normalize_vector(embedding)
+    if vector is None:
+        return
+
+    try:
+        payload = orjson.dumps(value).decode("utf-8")
+        now = time.time()
+        with _lock:
+            matrix, values, created = _load_semantic_index(namespace)
+            _conn.execute(
+                "INSERT INTO semantic_cache (namespace, embedding, value, created_at) VALUES (?, ?, ?, ?)",
+                (namespace, vector.tobytes(), payload, now),
+            )
+            if values and matrix.shape[1] == vector.shape[0]:
+                matrix = np.vstack([matrix, vector])[-SEMANTIC_CACHE_MAX_ENTRIES:]
+                values = (values + [payload])[-SEMANTIC_CACHE_MAX_ENTRIES:]
+                created = np.append(created, now)[-SEMANTIC_CACHE_MAX_ENTRIES:]
+            else:
+                matrix = vector.reshape(1, -1)
+                values = [payload]
+                created = np.array([now], dtype=np.float64)
+            _semantic_index[namespace] = (matrix, values, created)
+
+            _pending_writes += 1
+            if _pending_writes >= COMMIT_EVERY_WRITES:
+                _conn.commit()
+                _pending_writes = 0
+    except Exception as e:
+        logger.error(f"Fehler beim Speichern im semantischen Cache: {e}")
+
+
+# ---------------------------------------------------------
+# Embedding-Cache (Text-Hash -> Vektor)
+# ---------------------------------------------------------
+def get_cached_embeddings(keys: Sequence[str]) -> Dict[str, List[float]]:
+    """Liefert alle vorhandenen Embeddings zu keys in einem Query."""
+    if not keys or _connection() is None:
+        return {}
+
+    try:
+        unique_keys = list(dict.fromkeys(keys))
+        placeholders = ",".join("?" * len(unique_keys))
+        with _lock:
+            rows = _conn.execute(
+                f"SELECT key, embedding FROM embedding_cache WHERE key IN ({placeholders})",
+                unique_keys,
+            ).fetchall()
+        return {row[0]: np.frombuffer(row[1], dtype=np.float32).tolist() for row in rows}
+    except Exception as e:
+        logger.error(f"Fehler beim Lesen aus dem Embedding-Cache: {e}")
+        return {}
+
+
+def set_cached_embeddings(items: Dict[str, Sequence[float]]):
+    global _pending_writes
+    if not items or _connection() is None:
+        return
+
+    try:
+        now = time.time()
+        rows = [(key, np.asarray(vec, dtype=np.float32).tobytes(), now) for key, vec in items.items() if vec]
+        with _lock:
+            _conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (key, embedding, created_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            _pending_writes += len(rows)
+            if _pending_writes >= COMMIT_EVERY_WRITES:
+                _conn.commit()
+                _pending_writes = 0
+    except Exception as e:
+        logger.error(f"Fehler beim Speichern im Embedding-Cache: {e}")
 
 
 # ---------------------------------------------------------
 # Schreibe Cache auf Disk
 # ---------------------------------------------------------
 def save_cache():
+    global _pending_writes
+    if _conn is None:
+        return
+
     try:
-        CACHE_PATH.write_text(
-            json.dumps(_cache, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        with _lock:
+            _conn.commit()
+            _pending_writes = 0
     except Exception as e:
         logger.error(f"Fehler beim Speichern des Caches: {e}")
+
+
+atexit.register(save_cache)
@@ -0,0 +1,53 @@
+import asyncio
+from typing import Optional
+
+import feedparser
+import httpx
+
+# HTTP/2 nur, wenn das optionale h2-Paket installiert ist (httpx[http2]).
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = 10.0
+DEFAULT_HEADERS = {"User-Agent": feedparser.USER_AGENT}
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Gemeinsamer httpx-Client für alle Feed-Fetches eines Event-Loops.
+    Verbindungen (inkl. TLS) werden zwischen Aktien und Quellen wiederverwendet.
+    """
+    global _http_client, _http_client_loop
+    current_loop = asyncio.get_running_loop()
+
+    if _http_client is None or _http_client_loop is not current_loop:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+        )
+        _http_client_loop = current_loop
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Schließt den Client des aktuellen Loops, bevor der Loop beendet wird."""
+    global _http_client, _http_client_loop
+    if _http_client is None or _http_client_loop is not asyncio.get_running_loop():
+        return
+
+    client = _http_client
+    _http_client = None
+    _http_client_loop = None
+    await client.aclose()
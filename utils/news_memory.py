@@ -1,13 +1,20 @@
 import hashlib
-import json
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
+import numpy as np
+import orjson
 from loguru import logger
 
 MEMORY_PATH = Path("cache/news_memory.json")
+# Topic-Embeddings liegen binär neben der JSON-Datei, int8-quantisiert mit einer
+# Skala pro Zeile (Cosine-Abweichung < 1e-3); die Einträge verweisen per
+# embedding_row darauf. Eine Generation-ID in beiden Dateien stellt sicher, dass
+# JSON und Matrix vom selben Speichervorgang stammen.
+EMBEDDING_QMAX = 127
 TRACKING_PARAMS = {
     "utm_source",
     "utm_medium",
@@ -72,32 +79,131 @@ def build_summary_fingerprint(summary: str) -> str:
     return _sha256(normalize_text(summary))
 
 
+def _embeddings_path(path: Path) -> Path:
+    return path.with_suffix(".npz")
+
+
+def _quantize(matrix: np.ndarray):
+    """Symmetrische int8-Quantisierung pro Zeile (absmax -> 127)."""
+    absmax = np.abs(matrix).max(axis=1)
+    scales = np.where(absmax > 0, absmax / EMBEDDING_QMAX, 1.0).astype(np.float32)
+    quantized = np.clip(np.round(matrix / scales[:, None]), -EMBEDDING_QMAX, EMBEDDING_QMAX).astype(np.int8)
+    return quantized, scales
+
+
+def _load_embedding_matrix(path: Path) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """Liefert (Matrix, Generation); ältere Dateien haben keine Generation."""
+    emb_path = _embeddings_path(path)
+    legacy_path = path.with_suffix(".npy")  # float16 ohne Quantisierung
+    try:
+        if emb_path.exists():
+            with np.load(emb_path, allow_pickle=False) as data:
+                generation = str(data["generation"]) if "generation" in data.files else None
+                return data["vectors"].astype(np.float32) * data["scales"][:, None], generation
+        if legacy_path.exists():
+            return np.load(legacy_path, allow_pickle=False).astype(np.float32), None
+    except Exception as exc:
+        logger.error(f"Fehler beim Laden der News-Memory-Embeddings: {exc}")
+    return None, None
+
+
+def _attach_embeddings(entries: List[Dict[str, Any]], path: Path, generation: Optional[str]) -> None:
+    rows = [e for e in entries if "embedding_row" in e]
+    if not rows:
+        return
+
+    matrix, matrix_generation = _load_embedding_matrix(path)
+    if matrix is not None and matrix_generation != generation:
+        # Absturz zwischen den beiden Writes: Zeilenindizes passen nicht zur Matrix.
+        logger.warning("News-Memory-Embeddings passen nicht zur JSON-Datei – Embeddings werden verworfen.")
+        matrix = None
+    for entry in rows:
+        row = entry.pop("embedding_row")
+        if matrix is not None and isinstance(row, int) and 0 <= row < len(matrix):
+            entry["topic_embedding"] = matrix[row].tolist()
+        else:
+            entry["topic_embedding"] = []
+
+
 def load_memory(path: Path = MEMORY_PATH) -> Dict[str, Any]:
     if not path.exists():
         return {"version": 1, "entries": []}
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
         if not isinstance(data, dict):
             raise ValueError("memory root is not dict")
         data.setdefault("version", 1)
         data.setdefault("entries", [])
         if not isinstance(data["entries"], list):
             data["entries"] = []
+        _attach_embeddings(data["entries"], path, data.pop("embedding_generation", None))
         return data
     except Exception as exc:
         logger.error(f"Fehler beim Laden von News-Memory: {exc}")
         return {"version": 1, "entries": []}
 
 
+def _fit_dimension(embedding: Any, dim: int) -> List[float]:
+    """Kürzt längere Vektoren auf dim und normiert neu; kürzere sind nicht verwendbar."""
+    if not isinstance(embedding, list) or len(embedding) < dim:
+        return []
+    if len(embedding) == dim:
+        return embedding
+    vec = np.asarray(embedding[:dim], dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return (vec / norm).tolist() if norm > 0 else []
+
+
+def _split_embeddings(memory: Dict[str, Any]):
+    """Trennt Embeddings als Matrix von den JSON-Metadaten."""
+    # Private Laufzeit-Caches (z.B. _embedding_cache) werden nicht persistiert.
+    memory = {k: v for k, v in memory.items() if not str(k).startswith("_")}
+    entries = memory.get("entries", [])
+    embedded = [e.get("topic_embedding") for e in entries]
+    dim = next((len(v) for v in reversed(embedded) if isinstance(v, list) and v), 0)
+    if not dim:
+        return memory, None
+
+    # Nach einem Wechsel der Embedding-Dimension (z.B. 1536 -> 512) gilt die des
+    # jüngsten Eintrags; ältere Vektoren werden wie in _reference_matrix gekürzt,
+    # damit die Matrix weiter quantisiert neben der JSON-Datei liegt.
+    embedded = [_fit_dimension(v, dim) for v in embedded]
+
+    vectors = []
+    meta_entries = []
+    for entry, emb in zip(entries, embedded):
+        meta = {k: v for k, v in entry.items() if k != "topic_embedding"}
+        if isinstance(emb, list) and emb:
+            meta["embedding_row"] = len(vectors)
+            vectors.append(emb)
+        else:
+            meta["topic_embedding"] = []
+        meta_entries.append(meta)
+
+    return {**memory, "entries": meta_entries}, np.asarray(vectors, dtype=np.float32)
+
+
 def save_memory(memory: Dict[str, Any], path: Path = MEMORY_PATH) -> None:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
+        meta, matrix = _split_embeddings(memory)
+
+        # Embeddings zuerst schreiben; die Generation-ID in beiden Dateien erkennt
+        # beim Laden, wenn nach einem Absturz JSON und Matrix nicht zusammengehören.
+        if matrix is not None:
+            quantized, scales = _quantize(matrix)
+            generation = uuid.uuid4().hex
+            meta["embedding_generation"] = generation
+            emb_path = _embeddings_path(path)
+            tmp_emb_path = emb_path.with_suffix(".npz.tmp")
+            with tmp_emb_path.open("wb") as f:
+                np.savez(f, vectors=quantized, scales=scales, generation=np.array(generation))
+            tmp_emb_path.replace(emb_path)
+            path.with_suffix(".npy").unlink(missing_ok=True)  # float16-Altformat
+
         tmp_path = path.with_suffix(".tmp")
-        tmp_path.write_text(
-            json.dumps(memory, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        tmp_path.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
         tmp_path.replace(path)
     except Exception as exc:
         logger.error(f"Fehler beim Speichern von News-Memory: {exc}")
@@ -200,6 +306,70 @@ def find_semantic_match(
     return None
 
 
+def normalized_matrix(vectors: List[List[float]], dim: int) -> np.ndarray:
+    """L2-normierte (n, dim)-Matrix; leere/abweichende Vektoren werden Nullzeilen (Score 0)."""
+    matrix = np.zeros((len(vectors), dim), dtype=np.float32)
+    for row, vec in enumerate(vectors):
+        if isinstance(vec, list) and len(vec) == dim:
+            matrix[row] = vec
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def _reference_matrix(
+    stock_entries: List[Dict[str, Any]],
+    dim: int,
+    matrix_cache: Optional[Dict[Any, Any]] = None,
+):
+    """Normierte Memory-Matrix einer Aktie; mit matrix_cache nur einmal pro Lauf gebaut."""
+    # Schlüssel über die Identität der Einträge: neue/entfernte Einträge ergeben einen neuen Key.
+    key = (dim, tuple(id(e) for e in stock_entries))
+    if matrix_cache is not None and key in matrix_cache:
+        return matrix_cache[key]
+
+    # Längere Vektoren (z.B. 1536er aus älteren Läufen) werden auf dim gekürzt und
+    # neu normiert – bei text-embedding-3 entspricht das dem dimensions-Parameter.
+    ref_entries = [
+        e for e in stock_entries
+        if isinstance(e.get("topic_embedding"), list) and len(e["topic_embedding"]) >= dim
+    ]
+    ref_matrix = (
+        normalized_matrix([e["topic_embedding"][:dim] for e in ref_entries], dim) if ref_entries else None
+    )
+    if matrix_cache is not None:
+        matrix_cache[key] = (ref_entries, ref_matrix)
+    return ref_entries, ref_matrix
+
+
+def find_semantic_matches(
+    stock_entries: List[Dict[str, Any]],
+    candidate_embeddings: List[Optional[List[float]]],
+    threshold: float,
+    matrix_cache: Optional[Dict[Any, Any]] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Wie find_semantic_match, aber für alle Kandidaten gleichzeitig:
+    ein einziges Matmul (m x d) @ (d x n) statt m*n Python-Cosines.
+    """
+    matches: List[Optional[Dict[str, Any]]] = [None] * len(candidate_embeddings)
+    dim = next((len(v) for v in candidate_embeddings if v), 0)
+    if not dim:
+        return matches
+
+    ref_entries, ref_matrix = _reference_matrix(stock_entries, dim, matrix_cache)
+    if not ref_entries:
+        return matches
+
+    sims = normalized_matrix(candidate_embeddings, dim) @ ref_matrix.T
+    best_rows = sims.argmax(axis=1)
+    for idx, best in enumerate(best_rows):
+        score = float(sims[idx, best])
+        if score > 0.0 and score >= threshold:
+            matches[idx] = {"entry": ref_entries[best], "score": score}
+    return matches
+
+
 def build_memory_entry(
     stock_name: str,
     article: Dict[str, Any],
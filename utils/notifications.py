@@ -175,18 +175,24 @@ def split_message(text: str, max_len: int = TELEGRAM_MAX_LENGTH) -> list:
     
     chunks = []
     lines = text.split('\n')
-    current = ""
+    # Zeilen sammeln und pro Chunk einmal joinen statt String-Konkatenation.
+    current = []
+    current_len = 0
     
     for line in lines:
-        if len(current) + len(line) + 1 <= max_len:
-            current += line + '\n'
+        if current_len + len(line) + 1 <= max_len:
+            current.append(line)
+            current_len += len(line) + 1
         else:
             if current:
-                chunks.append(current.strip())
-            current = line + '\n'
+                chunks.append('\n'.join(current).strip())
+            current = [line]
+            current_len = len(line) + 1
     
-    if current.strip():
-        chunks.append(current.strip())
+    if current:
+        last = '\n'.join(current).strip()
+        if last:
+            chunks.append(last)
     
     return chunks
 
@@ -0,0 +1,134 @@
+import asyncio
+import os
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+import openai
+from dotenv import load_dotenv
+from loguru import logger
+from openai import AsyncOpenAI, OpenAI
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+from config.settings_loader import load_settings
+from utils.http_client import HTTP2_AVAILABLE
+
+load_dotenv()
+
+T = TypeVar("T")
+
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+HTTP_TIMEOUT = 30.0
+
+# Nur transiente Fehler wiederholen – BadRequest & Co. schlagen sofort durch.
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+MAX_RETRY_AFTER_SECONDS = 60.0
+_backoff = wait_random_exponential(min=1, max=30)
+
+_async_client: Optional[AsyncOpenAI] = None
+_async_client_loop = None
+_sync_client: Optional[OpenAI] = None
+
+
+def get_async_client() -> AsyncOpenAI:
+    """
+    Gemeinsamer AsyncOpenAI-Client pro Event-Loop.
+    Wird erst beim ersten Aufruf erzeugt; ein neuer Loop (z.B. nächster
+    asyncio.run im Scheduler) bekommt einen frischen Client samt Pool.
+    """
+    global _async_client, _async_client_loop
+    current_loop = asyncio.get_running_loop()
+
+    if _async_client is None or _async_client_loop is not current_loop:
+        _async_client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            max_retries=0,  # Retries laufen über call_with_retries
+            # HTTP/2: parallele Calls teilen sich gemultiplext wenige TLS-Verbindungen.
+            http_client=httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+        )
+        _async_client_loop = current_loop
+
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Schließt den Client des aktuellen Loops, bevor der Loop beendet wird."""
+    global _async_client, _async_client_loop
+    if _async_client is None or _async_client_loop is not asyncio.get_running_loop():
+        return
+
+    client = _async_client
+    _async_client = None
+    _async_client_loop = None
+    await client.close()
+
+
+def get_sync_client() -> OpenAI:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=httpx.Client(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+        )
+    return _sync_client
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    raw = response.headers.get("retry-after")
+    try:
+        return min(MAX_RETRY_AFTER_SECONDS, max(0.0, float(raw)))
+    except (TypeError, ValueError):
+        return None
+
+
+def _wait_strategy(retry_state) -> float:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, openai.RateLimitError):
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return retry_after
+    return _backoff(retry_state)
+
+
+def _log_retry(retry_state) -> None:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    logger.warning(
+        f"OpenAI-Call fehlgeschlagen ({type(exc).__name__}), "
+        f"Versuch {retry_state.attempt_number} – neuer Versuch in {retry_state.next_action.sleep:.1f}s"
+    )
+
+
+async def call_with_retries(
+    fn: Callable[[], Awaitable[T]],
+    attempts: Optional[int] = None,
+    on_rate_limit: Optional[Callable[[], Awaitable[None]]] = None,
+) -> T:
+    """
+    Führt einen OpenAI-Call mit jittered Exponential-Backoff aus.
+    Bei 429 wird ein vorhandener Retry-After-Header statt des Backoffs genutzt
+    und on_rate_limit aufgerufen (z.B. um die Parallelität zu senken).
+    """
+    if attempts is None:
+        attempts = int((load_settings().get("performance", {}) or {}).get("retries", 3))
+
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        wait=_wait_strategy,
+        stop=stop_after_attempt(max(1, attempts)),
+        before_sleep=_log_retry,
+        reraise=True,
+    ):
+        with attempt:
+            try:
+                return await fn()
+            except openai.RateLimitError:
+                if on_rate_limit is not None:
+                    await on_rate_limit()
+                raise
@@ -1,5 +1,28 @@
 import re
 import unicodedata
+from functools import lru_cache
+
+
+# ---------------------------------------------------------
+# Vorkompilierte Muster (einmal pro Prozess statt pro Aufruf)
+# ---------------------------------------------------------
+_EXCHANGE_TICKER_RE = re.compile(r"\([A-Z]{2,10}:[A-Z]{2,10}\)")   # (NASDAQ:MSFT)
+_CASHTAG_RE = re.compile(r"\$[A-Z]{1,10}")                        # $MSFT
+_TICKER_RE = re.compile(
+    r"\([A-Z]{2,10}:[A-Z]{2,10}\)"   # (NASDAQ:MSFT)
+    r"|\$[A-Z]{1,10}"                 # $MSFT
+    r"|\([A-Z]{2,6}\)"                # (MSFT)
+)
+_BOILERPLATE_RE = re.compile(
+    r"Subscribe to our newsletter.*"
+    r"|Sign up to receive.*"
+    r"|Follow us on.*"
+    r"|Alle Rechte vorbehalten.*"
+    r"|Hier klicken um mehr zu lesen.*"
+    r"|Du willst keine News verpassen.*",
+    flags=re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
 
 
 # ---------------------------------------------------------
@@ -24,11 +47,11 @@ def clean_title(title: str) -> str:
     title = fix_encoding(title)
 
     # (NASDAQ:MSFT), $AAPL etc entfernen
-    title = re.sub(r"\([A-Z]{2,10}:[A-Z]{2,10}\)", "", title)
-    title = re.sub(r"\$[A-Z]{1,10}", "", title)
+    title = _EXCHANGE_TICKER_RE.sub("", title)
+    title = _CASHTAG_RE.sub("", title)
 
     # doppelte spaces
-    title = re.sub(r"\s+", " ", title).strip()
+    title = _WS_RE.sub(" ", title).strip()
 
     return title
 
@@ -40,15 +63,7 @@ def remove_tickers(text: str) -> str:
     if not text:
         return text
 
-    patterns = [
-        r"\([A-Z]{2,10}:[A-Z]{2,10}\)",   # (NASDAQ:MSFT)
-        r"\$[A-Z]{1,10}",                 # $MSFT
-        r"\([A-Z]{2,6}\)",                # (MSFT)
-    ]
-    for p in patterns:
-        text = re.sub(p, "", text)
-
-    return text
+    return _TICKER_RE.sub("", text)
 
 
 # ---------------------------------------------------------
@@ -58,19 +73,7 @@ def remove_boilerplate(text: str) -> str:
     if not text:
         return ""
 
-    boiler_patterns = [
-        r"Subscribe to our newsletter.*",
-        r"Sign up to receive.*",
-        r"Follow us on.*",
-        r"Alle Rechte vorbehalten.*",
-        r"Hier klicken um mehr zu lesen.*",
-        r"Du willst keine News verpassen.*",
-    ]
-
-    for bp in boiler_patterns:
-        text = re.sub(bp, "", text, flags=re.IGNORECASE)
-
-    return text
+    return _BOILERPLATE_RE.sub("", text)
 
 
 # ---------------------------------------------------------
@@ -79,7 +82,7 @@ def remove_boilerplate(text: str) -> str:
 def normalize_whitespace(text: str) -> str:
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
 # ---------------------------------------------------------
@@ -94,6 +97,7 @@ def limit_length(text: str, max_chars: int = 2000) -> str:
 # ---------------------------------------------------------
 # Gesamter Text-Cleaner (für AI)
 # ---------------------------------------------------------
+@lru_cache(maxsize=1024)
 def clean_text(text: str) -> str:
     if not text:
         return ""
@@ -1,14 +1,20 @@
+import re
+from functools import lru_cache
 from pathlib import Path
-import yaml
+from typing import Mapping, Tuple
 
-with open(Path("config/settings.yaml"), "r", encoding="utf-8") as f:
-    settings = yaml.safe_load(f)
-LANG = settings.get("language", "de")
+from config.settings_loader import load_settings
 
+LANG = load_settings().get("language", "de")
+_PLACEHOLDER_RE = re.compile(r"\{([a-z_]+)\}")
+
+
+@lru_cache(maxsize=32)
 def load_prompt(name: str) -> str:
     """
     Lädt Prompt-Datei und ersetzt nur {language} –
     ohne Python-Format-Parsing, vollständig sicher.
+    Ergebnis wird pro Name gecacht (Prompts ändern sich nur per Deploy).
     """
     path = Path("config/prompts") / f"{name}.txt"
     if not path.exists():
@@ -20,3 +26,29 @@ def load_prompt(name: str) -> str:
     raw = raw.replace("{language}", LANG)
 
     return raw
+
+
+@lru_cache(maxsize=32)
+def load_prompt_template(name: str) -> Tuple[str, ...]:
+    """
+    Zerlegt den Prompt einmalig in Literal- und Platzhalter-Teile.
+    Gerade Indizes sind Text, ungerade Indizes Platzhalternamen.
+    """
+    return tuple(_PLACEHOLDER_RE.split(load_prompt(name)))
+
+
+def render_prompt(name: str, values: Mapping[str, str]) -> str:
+    """
+    Setzt Werte in einem Durchlauf ein (kein .format(), keine Kaskade von .replace()).
+    Unbekannte Platzhalter bleiben unverändert stehen.
+    """
+    parts = load_prompt_template(name)
+    out = []
+    for idx, part in enumerate(parts):
+        if idx % 2 == 0:
+            out.append(part)
+        elif part in values:
+            out.append(str(values[part]))
+        else:
+            out.append(f"{{{part}}}")
+    return "".join(out)
@@ -6,6 +6,8 @@ from typing import Any, Dict, List
 
 import yaml
 
+from config.settings_loader import SafeLoader
+
 SETTINGS_PATH = Path("config/settings.yaml")
 BACKUP_DIR = Path("config/backups")
 _SETTINGS_WRITE_LOCK = threading.Lock()
@@ -16,7 +18,7 @@ def load_settings_file(settings_path: Path = None) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"settings.yaml fehlt unter {path}")
     with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=SafeLoader) or {}
     return data
 
 